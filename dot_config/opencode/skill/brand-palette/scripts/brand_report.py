@@ -37,7 +37,7 @@ import json
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import List, Literal, cast
+from typing import List, Literal, Sequence, cast
 
 # Import from sibling modules
 from brandcolor import (
@@ -52,7 +52,7 @@ from palette import (
     find_anchor_level,
     auto_adjust_palette_contrast,
     Palette,
-    LEVELS,
+    LEVEL_KEYS,
     Gamut,
 )
 
@@ -93,7 +93,7 @@ LABEL_MAP = {
 # ========== Data Structures ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportData:
     """All data needed for the report."""
 
@@ -134,14 +134,13 @@ def format_tailwind_config(palette: Palette, use_oklch: bool = True) -> str:
         js_name = f"'{name}'" if "-" in name else name
 
         scale_lines = [f"      {js_name}: {{"]
-        for level in LEVELS:
-            color = scale.colors.get(level)
+        for key, color in zip(LEVEL_KEYS, scale.colors):
             if color:
                 if use_oklch:
                     value = color.css_oklch
                 else:
                     value = color.hex_srgb
-                scale_lines.append(f"        {level}: '{value}',")
+                scale_lines.append(f"        {key}: '{value}',")
         scale_lines.append("      },")
         return scale_lines
 
@@ -159,7 +158,7 @@ def format_tailwind_config(palette: Palette, use_oklch: bool = True) -> str:
     return "\n".join(lines)
 
 
-def format_palette_block(hex_list: List[str], aliases: List[str]) -> str:
+def format_palette_block(hex_list: List[str], aliases: Sequence[str]) -> str:
     """Format a palette code block for Obsidian."""
     lines = ["```palette"]
     lines.append(", ".join(hex_list))
@@ -191,8 +190,7 @@ def format_chroma_section(
 
         lines.append(f"### {SCALE_TITLES[name]}")
         lines.append("")
-        aliases = [str(level) for level in LEVELS]
-        lines.append(format_palette_block(hex_list, aliases))
+        lines.append(format_palette_block(hex_list, LEVEL_KEYS))
         lines.append("")
 
     # Tailwind config (OKLCH handles P3/sRGB automatically)
@@ -257,8 +255,8 @@ def generate_report(data: ReportData) -> str:
     # Add neutral endpoints to brand colors line for quick reference
     neutral_scale = data.input_palette.scales.get("neutral")
     if neutral_scale:
-        neutral_light = neutral_scale.colors[50].hex_srgb
-        neutral_dark = neutral_scale.colors[950].hex_srgb
+        neutral_light = neutral_scale.color(50).hex_srgb
+        neutral_dark = neutral_scale.color(950).hex_srgb
         all_anchors = hex_list_srgb + [neutral_light, neutral_dark]
         lines.append("**With neutrals:**")
         lines.append("")
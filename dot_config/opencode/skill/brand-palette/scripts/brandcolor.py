@@ -96,7 +96,7 @@ def build_ryb_palette(
 # ---------- Data Structures ----------
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandColorResult:
     """Complete brand color computation result."""
 
@@ -171,6 +171,9 @@ def compute_brand_colors(
 
     # Step 1: Weighted primary on RYB
     H_ryb = circular_mean_deg(hues_ryb, weights)
+    if H_ryb is None:
+        # Weighted hues cancel out, so there is no mean; keep the first
+        H_ryb = hues_ryb[0]
 
     # Step 2: Build requested RYB palette
     ryb_palette = build_ryb_palette(H_ryb, palette_set, x_deg, include_complementary)
@@ -15,9 +15,33 @@ Note: This module requires the coloraide library for accurate color space conver
 """
 
 import math
-from typing import Dict, List, Literal, Optional, Tuple
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from coloraide import Color
+
+# coloraide takes most of the import time of every entry point, so it is
+# loaded on the first conversion rather than at import (keeps --help fast)
+_Color = None
+
+
+def _color(space: str, coords: List[float]) -> "Color":
+    """Create a coloraide Color, importing coloraide on first use."""
+    global _Color
+    if _Color is None:
+        from coloraide import Color as _Color
+    return _Color(space, coords)
 
-from coloraide import Color
 
 Gamut = Literal["srgb", "p3"]
 
@@ -44,8 +68,13 @@ def mod360(h: float) -> float:
     return (h % 360.0 + 360.0) % 360.0
 
 
-def circular_mean_deg(hues_deg: List[float], weights: List[float]) -> float:
-    """Compute weighted circular mean of angles in degrees."""
+def circular_mean_deg(hues_deg: List[float], weights: List[float]) -> Optional[float]:
+    """
+    Compute weighted circular mean of angles in degrees.
+
+    Returns None when the mean is undefined: all weights are zero, or the
+    weighted hues cancel out (e.g. two equally weighted complements).
+    """
     x = 0.0
     y = 0.0
     wsum = 0.0
@@ -54,8 +83,8 @@ def circular_mean_deg(hues_deg: List[float], weights: List[float]) -> float:
         x += w * math.cos(t)
         y += w * math.sin(t)
         wsum += w
-    if wsum == 0 or (abs(x) < 1e-12 and abs(y) < 1e-12):
-        return 0.0
+    if wsum == 0 or math.hypot(x, y) < 1e-9:
+        return None
     ang = math.atan2(y, x)
     d = (rad_to_deg(ang) + 360.0) % 360.0
     return d
@@ -811,16 +840,20 @@ def oklch_to_linear_p3(L: float, C: float, h_deg: float) -> Tuple[float, float,
 
 def oklch_in_p3_gamut(L: float, C: float, h_deg: float, eps: float = 1e-6) -> bool:
     """Check if OKLCH color is within Display P3 gamut."""
-    c = Color("oklch", [L, C, h_deg])
+    c = _color("oklch", [L, C, h_deg])
     return c.in_gamut("display-p3")
 
 
 def oklch_in_srgb_gamut(L: float, C: float, h_deg: float) -> bool:
     """Check if OKLCH color is within sRGB gamut."""
-    c = Color("oklch", [L, C, h_deg])
+    c = _color("oklch", [L, C, h_deg])
     return c.in_gamut("srgb")
 
 
+# Memoized on the exact arguments: auto_adjust_palette_contrast converts
+# the (L, C, h) picked by auto_adjust_for_contrast, which the search has
+# already converted while scoring it.
+@lru_cache(maxsize=4096)
 def oklch_to_p3(L: float, C: float, h_deg: float) -> Tuple[float, float, float, bool]:
     """
     Convert OKLCH to Display P3 [0,1] using coloraide library with gamut mapping.
@@ -828,7 +861,7 @@ def oklch_to_p3(L: float, C: float, h_deg: float) -> Tuple[float, float, float,
     Returns (r, g, b, in_gamut) where in_gamut indicates if the original
     color was within P3 gamut before mapping.
     """
-    c = Color("oklch", [L, C, h_deg])
+    c = _color("oklch", [L, C, h_deg])
     in_gamut = c.in_gamut("display-p3")
 
     # Use CSS-style gamut mapping (reduces chroma while preserving L and H)
@@ -884,6 +917,7 @@ def linear_rgb_in_gamut(r: float, g: float, b: float, eps: float = 1e-9) -> bool
     return -eps <= r <= 1.0 + eps and -eps <= g <= 1.0 + eps and -eps <= b <= 1.0 + eps
 
 
+@lru_cache(maxsize=4096)
 def oklch_to_srgb(L: float, C: float, h_deg: float) -> Tuple[float, float, float, bool]:
     """
     Convert OKLCH to sRGB [0,1] using coloraide library with gamut mapping.
@@ -891,7 +925,7 @@ def oklch_to_srgb(L: float, C: float, h_deg: float) -> Tuple[float, float, float
     Returns (r, g, b, in_gamut) where in_gamut indicates if the original
     color was within sRGB gamut before mapping.
     """
-    c = Color("oklch", [L, C, h_deg])
+    c = _color("oklch", [L, C, h_deg])
     in_gamut = c.in_gamut("srgb")
 
     # Use CSS-style gamut mapping (reduces chroma while preserving L and H)
@@ -905,6 +939,61 @@ def oklch_to_srgb(L: float, C: float, h_deg: float) -> Tuple[float, float, float
     return r, g, b, in_gamut
 
 
+def oklch_to_p3_and_srgb(
+    L: float, C: float, h_deg: float, map_out_of_gamut: bool = True
+) -> Optional[
+    Tuple[Tuple[float, float, float, bool], Tuple[float, float, float, bool]]
+]:
+    """
+    Convert OKLCH to both Display P3 and sRGB [0,1] in one pass.
+
+    Equivalent to (oklch_to_p3(L, C, h), oklch_to_srgb(L, C, h)), but builds
+    the source color once and reuses each converted color for its gamut
+    check instead of converting again inside in_gamut(). Since sRGB lies
+    inside P3, the P3 gamut check only runs for colors outside sRGB.
+
+    Args:
+        L, C, h_deg: OKLCH color
+        map_out_of_gamut: If False and the color is outside P3, return None
+            instead of gamut-mapping both results (for callers that reduce
+            chroma themselves and convert again)
+
+    Returns:
+        ((p3_r, p3_g, p3_b, p3_in_gamut), (srgb_r, srgb_g, srgb_b, srgb_in_gamut)),
+        or None (see map_out_of_gamut)
+    """
+    c = _color("oklch", [L, C, h_deg])
+
+    srgb = c.convert("srgb")
+    srgb_in_gamut = srgb.in_gamut()
+    p3 = c.convert("display-p3")
+    p3_in_gamut = srgb_in_gamut or p3.in_gamut()
+
+    if not p3_in_gamut:
+        if not map_out_of_gamut:
+            return None
+        # fit() maps in place, so work on a copy to keep c intact for sRGB
+        p3 = c.clone().fit("display-p3", method="oklch-chroma").convert("display-p3")
+
+    if not srgb_in_gamut:
+        srgb = c.fit("srgb", method="oklch-chroma").convert("srgb")
+
+    return (
+        (
+            clamp(p3["red"], 0.0, 1.0),
+            clamp(p3["green"], 0.0, 1.0),
+            clamp(p3["blue"], 0.0, 1.0),
+            p3_in_gamut,
+        ),
+        (
+            clamp(srgb["red"], 0.0, 1.0),
+            clamp(srgb["green"], 0.0, 1.0),
+            clamp(srgb["blue"], 0.0, 1.0),
+            srgb_in_gamut,
+        ),
+    )
+
+
 # ========== Hex Conversion ==========
 
 
@@ -918,11 +1007,8 @@ def hex_from_rgb01(r: float, g: float, b: float) -> str:
 
 def rgb01_from_hex(hex_str: str) -> Tuple[float, float, float]:
     """Convert hex string to RGB [0,1]."""
-    hex_str = hex_str.lstrip("#")
-    r = int(hex_str[0:2], 16) / 255.0
-    g = int(hex_str[2:4], 16) / 255.0
-    b = int(hex_str[4:6], 16) / 255.0
-    return r, g, b
+    r, g, b = bytes.fromhex(hex_str.lstrip("#")[:6])
+    return r / 255.0, g / 255.0, b / 255.0
 
 
 def srgb_to_oklch(r: float, g: float, b: float) -> Tuple[float, float, float]:
@@ -935,7 +1021,7 @@ def srgb_to_oklch(r: float, g: float, b: float) -> Tuple[float, float, float]:
     Returns:
         (L, C, H) where L is 0-1, C is 0-0.37, H is 0-360 degrees
     """
-    c = Color("srgb", [r, g, b])
+    c = _color("srgb", [r, g, b])
     oklch = c.convert("oklch")
     L = oklch["lightness"]
     C = oklch["chroma"]
@@ -956,6 +1042,13 @@ def hex_to_oklch(hex_str: str) -> Tuple[float, float, float]:
     Returns:
         (L, C, H) where L is 0-1, C is 0-0.37, H is 0-360 degrees
     """
+    # Normalize so "#ff5500" and "FF5500" share a cache entry
+    return _hex_to_oklch_cached(hex_str.lstrip("#")[:6].upper())
+
+
+@lru_cache(maxsize=1024)
+def _hex_to_oklch_cached(hex_str: str) -> Tuple[float, float, float]:
+    """hex_to_oklch for a normalized 6-digit hex string (no #, uppercase)."""
     r, g, b = rgb01_from_hex(hex_str)
     return srgb_to_oklch(r, g, b)
 
@@ -1012,14 +1105,80 @@ def ryb_hue_to_oklch_hue(ryb_h_deg: float) -> float:
 
 # ========== Max Chroma Search ==========
 
+# OKLab LMS (cube) -> linear sRGB rows, as in oklab_to_linear_srgb
+_LMS3_TO_LINEAR_SRGB = (
+    (4.0767416621, -3.3077115913, 0.2309699292),
+    (-1.2684380046, 2.6097574011, -0.3413193965),
+    (-0.0041960863, -0.7034186147, 1.7076147010),
+)
 
+
+def _srgb_chroma_gamut_fn(
+    L: float, h_deg: float, eps: float = 1e-9
+) -> Callable[[float], bool]:
+    """
+    Build an sRGB gamut test along the chroma axis at fixed L and hue.
+
+    With L and h fixed, each LMS' component is linear in C
+    (L + C * k), so the hue trig and OKLab coefficients are folded into
+    k_l/k_m/k_s once and each test is just three cubes and a 3x3 dot.
+    Equivalent to linear_rgb_in_gamut(*oklch_to_linear_srgb(L, C, h)).
+    """
+    h = deg_to_rad(h_deg)
+    cos_h = math.cos(h)
+    sin_h = math.sin(h)
+    k_l = 0.3963377774 * cos_h + 0.2158037573 * sin_h
+    k_m = -0.1055613458 * cos_h - 0.0638541728 * sin_h
+    k_s = -0.0894841775 * cos_h - 1.2914855480 * sin_h
+    (r_l, r_m, r_s), (g_l, g_m, g_s), (b_l, b_m, b_s) = _LMS3_TO_LINEAR_SRGB
+    lo, hi = -eps, 1.0 + eps
+
+    def in_gamut(C: float) -> bool:
+        l_ = L + C * k_l
+        m_ = L + C * k_m
+        s_ = L + C * k_s
+        l = l_ * l_ * l_
+        m = m_ * m_ * m_
+        s = s_ * s_ * s_
+        return (
+            lo <= r_l * l + r_m * m + r_s * s <= hi
+            and lo <= g_l * l + g_m * m + g_s * s <= hi
+            and lo <= b_l * l + b_m * m + b_s * s <= hi
+        )
+
+    return in_gamut
+
+
+def _p3_chroma_gamut_fn(L: float, h_deg: float) -> Callable[[float], bool]:
+    """
+    Build a Display P3 gamut test along the chroma axis at fixed L and hue.
+
+    Reuses one coloraide Color and only rewrites its chroma per probe,
+    instead of constructing a new Color for every test.
+    Equivalent to oklch_in_p3_gamut(L, C, h_deg).
+    """
+    color = _color("oklch", [L, 0.0, h_deg])
+    color_in_gamut = color.in_gamut
+
+    def in_gamut(C: float) -> bool:
+        color[1] = C
+        return color_in_gamut("display-p3")
+
+    return in_gamut
+
+
+# Memoized: scale generation asks for the same (L, h) boundary repeatedly
+# (e.g. the anchor's c_max at every level of a ColorBox scale, and again
+# for each palette variant), and each search costs ~36 gamut tests.
+@lru_cache(maxsize=4096)
 def cmax_for_L_h(
     L: float, h_deg: float, gamut: Gamut = "srgb", hi_start: float = 0.5
 ) -> float:
     """
     Find maximum chroma for given L and hue that stays in gamut.
 
-    Uses binary search with expanding upper bound.
+    Uses binary search with expanding upper bound. Results are cached per
+    (L, h_deg, gamut, hi_start).
 
     Args:
         L: Lightness value (0-1)
@@ -1034,15 +1193,13 @@ def cmax_for_L_h(
 
     # Select gamut check function based on target gamut
     if gamut == "p3":
-        in_gamut_fn = lambda L, C, h: oklch_in_p3_gamut(L, C, h)
+        in_gamut_fn = _p3_chroma_gamut_fn(L, h_deg)
     else:
-        in_gamut_fn = lambda L, C, h: linear_rgb_in_gamut(
-            *oklch_to_linear_srgb(L, C, h)
-        )
+        in_gamut_fn = _srgb_chroma_gamut_fn(L, h_deg)
 
     # Grow hi until out of gamut
     for _ in range(8):
-        if not in_gamut_fn(L, hi, h_deg):
+        if not in_gamut_fn(hi):
             break
         hi *= 1.5
         if hi > 1.2:
@@ -1052,7 +1209,7 @@ def cmax_for_L_h(
     # Binary search for boundary
     for _ in range(28):
         mid = 0.5 * (lo + hi)
-        if in_gamut_fn(L, mid, h_deg):
+        if in_gamut_fn(mid):
             lo = mid
         else:
             hi = mid
@@ -1060,6 +1217,25 @@ def cmax_for_L_h(
     return lo
 
 
+def cmax_for_L_hues(
+    L: float, hues_deg: Sequence[float], gamut: Gamut = "srgb"
+) -> List[float]:
+    """
+    Maximum in-gamut chroma at one lightness for several hues.
+
+    Callers that need the even-chroma floor take min() of the result.
+
+    Args:
+        L: Lightness value (0-1)
+        hues_deg: Hue angles in degrees
+        gamut: Target gamut ("srgb" or "p3")
+
+    Returns:
+        Max chroma per hue, in input order
+    """
+    return [cmax_for_L_h(L, h, gamut) for h in hues_deg]
+
+
 # ========== APCA Contrast Calculation ==========
 # Based on APCA-W3 version 0.98G-4g
 # Reference: https://github.com/Myndex/SAPC-APCA
@@ -1099,21 +1275,20 @@ _APCA_LO_FACTOR = 27.7847239587675
 _APCA_DELTA_Y_MIN = 0.0005
 
 
+# Weighted linearized sRGB channel per 8-bit code value. sRGB APCA inputs
+# are always integers 0-255, so each channel term is a table lookup.
+_APCA_S_R_LUT = tuple(_APCA_S_RCO * (c / 255.0) ** _APCA_MAIN_TRC for c in range(256))
+_APCA_S_G_LUT = tuple(_APCA_S_GCO * (c / 255.0) ** _APCA_MAIN_TRC for c in range(256))
+_APCA_S_B_LUT = tuple(_APCA_S_BCO * (c / 255.0) ** _APCA_MAIN_TRC for c in range(256))
+
+
 def srgb_to_y_apca(r: int, g: int, b: int) -> float:
     """
     Convert sRGB (0-255) to APCA luminance Y.
 
     Uses APCA's specific gamma and coefficients.
     """
-
-    def simple_exp(chan: int) -> float:
-        return (chan / 255.0) ** _APCA_MAIN_TRC
-
-    return (
-        _APCA_S_RCO * simple_exp(r)
-        + _APCA_S_GCO * simple_exp(g)
-        + _APCA_S_BCO * simple_exp(b)
-    )
+    return _APCA_S_R_LUT[r] + _APCA_S_G_LUT[g] + _APCA_S_B_LUT[b]
 
 
 def p3_to_y_apca(r: float, g: float, b: float) -> float:
@@ -1265,10 +1440,59 @@ def calc_apca_for_gamut(
     - For sRGB: Uses Rec. 709 luminance coefficients
     - For P3: Uses P3 primaries luminance coefficients
     """
+    return apca_func_for_gamut(gamut)(text_rgb, bg_rgb)
+
+
+# APCA function per gamut; anything other than "p3" uses sRGB coefficients
+_APCA_DISPATCH: Dict[str, Callable[..., float]] = {
+    "p3": calc_apca_p3,
+    "srgb": calc_apca_from_rgb01,
+}
+
+
+def apca_func_for_gamut(
+    gamut: Gamut,
+) -> Callable[[Tuple[float, float, float], Tuple[float, float, float]], float]:
+    """
+    APCA function for a gamut, for loops that score many colors in one gamut.
+
+    Returns calc_apca_p3 for "p3" and calc_apca_from_rgb01 otherwise.
+    """
+    return _APCA_DISPATCH.get(gamut, calc_apca_from_rgb01)
+
+
+def calc_apca_batch(
+    text_rgbs: Sequence[Tuple[float, float, float]],
+    bg_rgb: Tuple[float, float, float],
+    gamut: Gamut,
+) -> List[float]:
+    """
+    Calculate APCA contrast for many text colors against one background.
+
+    Equivalent to calling calc_apca_for_gamut() per color, but the
+    background luminance and the gamut dispatch are resolved once.
+
+    Args:
+        text_rgbs: Colors as (r, g, b) tuples with values 0.0-1.0
+        bg_rgb: Background as (r, g, b) tuple with values 0.0-1.0
+        gamut: "srgb" or "p3" - determines which coefficients to use
+
+    Returns:
+        Lc values in the same order as text_rgbs
+    """
     if gamut == "p3":
-        return calc_apca_p3(text_rgb, bg_rgb)
-    else:
-        return calc_apca_from_rgb01(text_rgb, bg_rgb)
+        bg_y = p3_to_y_apca(*bg_rgb)
+        return [apca_contrast(p3_to_y_apca(*rgb), bg_y) for rgb in text_rgbs]
+
+    def to_y(rgb: Tuple[float, float, float]) -> float:
+        return srgb_to_y_apca(
+            int(round(rgb[0] * 255)),
+            int(round(rgb[1] * 255)),
+            int(round(rgb[2] * 255)),
+        )
+
+    bg_y = to_y(bg_rgb)
+    return [apca_contrast(to_y(rgb), bg_y) for rgb in text_rgbs]
 
 
 def auto_adjust_for_contrast(
@@ -1299,14 +1523,26 @@ def auto_adjust_for_contrast(
     Note: When gamut="p3", bg_rgb should be P3 values and APCA uses P3 coefficients.
           When gamut="srgb", bg_rgb should be sRGB values and APCA uses sRGB coefficients.
     """
-    L_original = L
+    lighter = direction == "lighter"
 
     # Set search bounds based on direction
-    if direction == "lighter":
+    if lighter:
         L_low, L_high = L, min(L + max_delta_l, 0.99)
     else:
         L_low, L_high = max(L - max_delta_l, 0.01), L
 
+    # Resolve the gamut-specific steps once rather than on every iteration
+    if gamut == "p3":
+        in_gamut = oklch_in_p3_gamut
+        to_rgb = oklch_to_p3
+    else:
+
+        def in_gamut(L: float, C: float, H: float) -> bool:
+            return linear_rgb_in_gamut(*oklch_to_linear_srgb(L, C, H))
+
+        to_rgb = oklch_to_srgb
+    calc_apca_rgb01 = apca_func_for_gamut(gamut)
+
     best_L = L
     best_C = C
     best_lc = 0.0
@@ -1317,20 +1553,12 @@ def auto_adjust_for_contrast(
 
         # Check if in gamut, reduce C if needed
         C_test = C
-        if gamut == "p3":
-            if not oklch_in_p3_gamut(L_mid, C_test, H):
-                C_test = cmax_for_L_h(L_mid, H, "p3") * 0.98
-        else:
-            if not linear_rgb_in_gamut(*oklch_to_linear_srgb(L_mid, C_test, H)):
-                C_test = cmax_for_L_h(L_mid, H, "srgb") * 0.98
+        if not in_gamut(L_mid, C_test, H):
+            C_test = cmax_for_L_h(L_mid, H, gamut) * 0.98
 
         # Convert to RGB and calculate APCA using gamut-appropriate method
-        if gamut == "p3":
-            r, g, b, _ = oklch_to_p3(L_mid, C_test, H)
-            lc = abs(calc_apca_p3((r, g, b), bg_rgb))
-        else:
-            r, g, b, _ = oklch_to_srgb(L_mid, C_test, H)
-            lc = abs(calc_apca_from_rgb01((r, g, b), bg_rgb))
+        r, g, b, _ = to_rgb(L_mid, C_test, H)
+        lc = abs(calc_apca_rgb01((r, g, b), bg_rgb))
 
         # Track best result
         if lc >= min_lc:
@@ -1338,13 +1566,13 @@ def auto_adjust_for_contrast(
             best_C = C_test
             best_lc = lc
             # Try to stay closer to original L
-            if direction == "lighter":
+            if lighter:
                 L_high = L_mid
             else:
                 L_low = L_mid
         else:
             # Need more contrast, move away from background
-            if direction == "lighter":
+            if lighter:
                 L_low = L_mid
             else:
                 L_high = L_mid
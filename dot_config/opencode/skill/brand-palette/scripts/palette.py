@@ -22,19 +22,22 @@ Examples:
 """
 
 import argparse
+import io
 import json
 import math
 import os
 import sys
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     from brandcolor import BrandColorResult
 
 from color_utils import (
     # Basic utilities
-    clamp,
     mod360,
     circular_mean_deg,
     # RYB/RGB/OKLCH conversion
@@ -43,6 +46,7 @@ from color_utils import (
     # Color conversions
     oklch_to_srgb,
     oklch_to_p3,
+    oklch_to_p3_and_srgb,
     hex_from_rgb01,
     css_p3_string,
     p3_to_srgb_fallback,
@@ -55,9 +59,10 @@ from color_utils import (
     srgb_to_oklch,
     # Max chroma
     cmax_for_L_h,
+    cmax_for_L_hues,
     # APCA
-    calc_apca_from_rgb01,
-    calc_apca_p3,
+    apca_func_for_gamut,
+    calc_apca_batch,
     APCA_THRESHOLD_LARGE_TEXT,
     # Shared hue parsing utilities
     RYB_ANCHOR_DEG,
@@ -93,6 +98,12 @@ def rgb_bg(r: int, g: int, b: int) -> str:
     return f"{ESC}[48;2;{r};{g};{b}m"
 
 
+# Whole-cell templates for the visualizations: color, content and reset in
+# one %-format per cell (foreground takes r, g, b and the text)
+BG_CELL_TEMPLATE = f"{ESC}[48;2;%d;%d;%dm  {RESET}"
+FG_TEXT_TEMPLATE = f"{ESC}[38;2;%d;%d;%dm%s{RESET}"
+
+
 def supports_truecolor() -> bool:
     """Check if terminal supports 24-bit color."""
     colorterm = os.environ.get("COLORTERM", "").lower()
@@ -108,23 +119,57 @@ def should_use_color(force: bool = False, no_color: bool = False) -> bool:
     return sys.stdout.isatty() and supports_truecolor()
 
 
+# Each visualization pass converts the same ~77 palette colors again, so
+# the 0-255 triples are memoized per (r, g, b).
+@lru_cache(maxsize=512)
 def rgb01_to_255(r: float, g: float, b: float) -> Tuple[int, int, int]:
     """Convert RGB 0-1 to 0-255."""
+    # Inline clamp; round() on a float already returns an int
     return (
-        int(round(clamp(r, 0.0, 1.0) * 255)),
-        int(round(clamp(g, 0.0, 1.0) * 255)),
-        int(round(clamp(b, 0.0, 1.0) * 255)),
+        0 if r <= 0.0 else 255 if r >= 1.0 else round(r * 255),
+        0 if g <= 0.0 else 255 if g >= 1.0 else round(g * 255),
+        0 if b <= 0.0 else 255 if b >= 1.0 else round(b * 255),
     )
 
 
 # ========== Constants ==========
 
 # Tonal scale levels (Tailwind convention)
-LEVELS = [50, 100, 200, 300, 400, 500, 600, 700, 800, 900, 950]
+LEVELS = (50, 100, 200, 300, 400, 500, 600, 700, 800, 900, 950)
+
+# Level names as used in output keys ("50", "100", ...), aligned with LEVELS
+LEVEL_KEYS = tuple(str(level) for level in LEVELS)
 
 # Level to t (0-1) mapping
 LEVEL_TO_T = {level: i / (len(LEVELS) - 1) for i, level in enumerate(LEVELS)}
 
+# Level to position in LEVELS (index into ColorScale.colors)
+_LEVEL_TO_IDX = {level: i for i, level in enumerate(LEVELS)}
+
+# (level, t) pairs in level order, so scale loops avoid per-level dict lookups
+_LEVEL_T_PAIRS = tuple((level, LEVEL_TO_T[level]) for level in LEVELS)
+
+# Output order of the scales: primary first, then the harmonies, neutral last
+SCALE_ORDER = (
+    "primary",
+    "analogous-cool",
+    "analogous-warm",
+    "complement",
+    "split-complement-cool",
+    "split-complement-warm",
+    "neutral",
+)
+SCALE_ORDER_SET = frozenset(SCALE_ORDER)
+
+# Backgrounds each level must contrast against: light levels (50-400) sit on
+# the dark background, dark levels (600-950) on the light one, 500 on both
+LEVEL_CHECKS: Dict[int, Tuple[str, ...]] = {
+    level: (
+        ("dark",) if level <= 400 else ("light",) if level >= 600 else ("light", "dark")
+    )
+    for level in LEVELS
+}
+
 
 # ========== Easing Functions ==========
 
@@ -144,6 +189,15 @@ def ease_in_out_quad(t: float) -> float:
     return 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t
 
 
+# (level, hue_t, sat_t, bri_t) for the ColorBox neutral curves:
+# HUE easeOut (fast start, slow finish), SATURATION easeIn (slow start,
+# fast finish), BRIGHTNESS easeInOut (slow at both ends)
+_COLORBOX_EASED = tuple(
+    (level, ease_out_quad(t), ease_in_quad(t), ease_in_out_quad(t))
+    for level, t in _LEVEL_T_PAIRS
+)
+
+
 # ========== ColorBox Algorithm for Neutrals ==========
 #
 # ColorBox (https://github.com/Automattic/colorbox) generates palettes
@@ -174,21 +228,14 @@ def colorbox_interpolate_hue(
     Returns:
         Interpolated hue (0-360)
     """
+    # Arc length travelled in the chosen direction, wrapping through 360
     if clockwise:
-        # Clockwise: if end < start, wrap around 360
-        if end_hue >= start_hue:
-            hue_delta = end_hue - start_hue
-        else:
-            hue_delta = (360 - start_hue) + end_hue
+        hue_delta = (end_hue - start_hue) % 360.0
     else:
-        # Counter-clockwise: if start < end, wrap around negative
-        if start_hue >= end_hue:
-            hue_delta = -(start_hue - end_hue)
-        else:
-            hue_delta = -(start_hue + (360 - end_hue))
+        hue_delta = -((start_hue - end_hue) % 360.0)
 
     hue = start_hue + hue_delta * t
-    return mod360(hue)
+    return hue % 360.0
 
 
 def compute_neutral_scale_colorbox(
@@ -232,21 +279,14 @@ def compute_neutral_scale_colorbox(
     # We'll store the mid-point hue as the scale's oklch_hue for reference
     scale = ColorScale(name="neutral", oklch_hue=rgb_hue_to_oklch_hue_deg(base_hsb_hue))
 
-    for level in LEVELS:
-        t = LEVEL_TO_T[level]
+    sat_span = sat_end - sat_start
+    bri_span = bri_end - bri_start
 
-        # Apply ColorBox curves:
-        # HUE: easeOut (fast start, slow finish)
-        hue_t = ease_out_quad(t)
+    for level, hue_t, sat_t, bri_t in _COLORBOX_EASED:
+        # Apply ColorBox curves (eased t values precomputed per level)
         hsb_hue = colorbox_interpolate_hue(hue_start, hue_end, hue_t, clockwise=True)
-
-        # SATURATION: easeIn (slow start, fast finish)
-        sat_t = ease_in_quad(t)
-        hsb_sat = sat_start + (sat_end - sat_start) * sat_t
-
-        # BRIGHTNESS: easeInOut (slow at both ends)
-        bri_t = ease_in_out_quad(t)
-        hsb_bri = bri_start + (bri_end - bri_start) * bri_t
+        hsb_sat = sat_start + sat_span * sat_t
+        hsb_bri = bri_start + bri_span * bri_t
 
         # Convert HSB to sRGB (0-1)
         srgb_r, srgb_g, srgb_b = hsv_to_srgb(hsb_hue, hsb_sat, hsb_bri)
@@ -276,11 +316,16 @@ def compute_neutral_scale_colorbox(
         color.p3_b = p3_b
         color.p3_in_gamut = p3_in_gamut
 
-        scale.colors[level] = color
+        scale.colors[_LEVEL_TO_IDX[level]] = color
 
     return scale
 
 
+# sin(t * pi) at each level's t, so the envelope skips libm for the
+# 11 canonical positions and only evaluates sin() for other t values
+_SIN_PI_BY_T = {t: math.sin(t * math.pi) for _, t in _LEVEL_T_PAIRS}
+
+
 def chroma_envelope(t: float, min_ratio: float = 0.15) -> float:
     """
     Chroma envelope that peaks at t=0.5, tapers toward min_ratio at t=0 and t=1.
@@ -295,15 +340,23 @@ def chroma_envelope(t: float, min_ratio: float = 0.15) -> float:
         min_ratio: Minimum chroma as ratio of peak (default 0.15 = 15%)
     """
     # sin curve scaled to range from min_ratio to 1.0
-    return min_ratio + (1.0 - min_ratio) * math.sin(t * math.pi)
+    sin_t = _SIN_PI_BY_T.get(t)
+    if sin_t is None:
+        sin_t = math.sin(t * math.pi)
+    return min_ratio + (1.0 - min_ratio) * sin_t
 
 
 # ========== Color Data Structures ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorValue:
-    """A single color at a specific level."""
+    """
+    A single color at a specific level.
+
+    Slotted: a palette holds ~77 of these, so dropping the per-instance
+    __dict__ keeps them compact and makes field access a slot lookup.
+    """
 
     level: int
     oklch_l: float
@@ -327,6 +380,16 @@ class ColorValue:
     apca_vs_light_bg: Optional[float] = None  # vs neutral-50
     apca_vs_dark_bg: Optional[float] = None  # vs neutral-950
 
+    @property
+    def p3_tuple(self) -> Tuple[float, float, float]:
+        """P3 channels as an (r, g, b) tuple."""
+        return (self.p3_r, self.p3_g, self.p3_b)
+
+    @property
+    def srgb_tuple(self) -> Tuple[float, float, float]:
+        """sRGB channels as an (r, g, b) tuple."""
+        return (self.srgb_r, self.srgb_g, self.srgb_b)
+
     @property
     def hex_p3(self) -> str:
         """Hex string for P3 (note: this is technically wrong for OOG colors)."""
@@ -348,25 +411,38 @@ class ColorValue:
         return f"oklch({self.oklch_l:.2%} {self.oklch_c:.4f} {self.oklch_h:.1f})"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorScale:
     """A full 11-step scale for a single hue."""
 
     name: str
     oklch_hue: float
-    colors: Dict[int, ColorValue] = field(default_factory=dict)
+    # Indexed by level position (see _LEVEL_TO_IDX), not by level number
+    colors: List[Optional[ColorValue]] = field(
+        default_factory=lambda: [None] * len(LEVELS)
+    )
+
+    def color(self, level: int) -> Optional[ColorValue]:
+        """Get the color at a level number (50-950)."""
+        return self.colors[_LEVEL_TO_IDX[level]]
 
     def get_hex_list(self, gamut: Gamut = "p3") -> List[str]:
         """Get list of hex values in level order."""
         result = []
-        for level in LEVELS:
-            color = self.colors.get(level)
+        for color in self.colors:
             if color:
                 result.append(color.hex_p3 if gamut == "p3" else color.hex_srgb)
         return result
 
+    def get_rgb255_list(
+        self, gamut: Gamut = "p3"
+    ) -> List[Optional[Tuple[int, int, int]]]:
+        """Get 0-255 RGB per level, aligned with colors (None where unset)."""
+        rgb = attrgetter("p3_tuple" if gamut == "p3" else "srgb_tuple")
+        return [rgb01_to_255(*rgb(color)) if color else None for color in self.colors]
 
-@dataclass
+
+@dataclass(slots=True)
 class Palette:
     """Complete palette with all scales."""
 
@@ -382,6 +458,11 @@ class Palette:
     neutral_light_bg_p3: Optional[Tuple[float, float, float]] = None  # neutral-50 P3
     neutral_dark_bg_p3: Optional[Tuple[float, float, float]] = None  # neutral-950 P3
 
+    def visible_scales(self) -> List[Tuple[str, ColorScale]]:
+        """(name, scale) pairs in SCALE_ORDER, skipping scales not in the palette."""
+        scales = self.scales
+        return [(name, scales[name]) for name in SCALE_ORDER if name in scales]
+
 
 # ========== Palette Name Mapping ==========
 
@@ -396,9 +477,12 @@ NAME_MAPPING = {
 }
 
 
+_NAME_MAP_GET = NAME_MAPPING.get
+
+
 def map_name(brandcolor_name: str) -> str:
     """Convert brandcolor.py name to palette.py positional name."""
-    return NAME_MAPPING.get(brandcolor_name, brandcolor_name)
+    return _NAME_MAP_GET(brandcolor_name, brandcolor_name)
 
 
 # ========== Scale Generation ==========
@@ -418,6 +502,10 @@ def generate_lightness(t: float) -> float:
     return L_LIGHT - (L_LIGHT - L_DARK) * ease_in_out_quad(t)
 
 
+# Default lightness per level, aligned with _LEVEL_T_PAIRS
+_DEFAULT_LIGHTNESS = tuple(generate_lightness(t) for _, t in _LEVEL_T_PAIRS)
+
+
 def find_anchor_level(anchor_L: float) -> Tuple[int, float]:
     """
     Find the level (50-950) whose default lightness best matches anchor_L.
@@ -432,8 +520,7 @@ def find_anchor_level(anchor_L: float) -> Tuple[int, float]:
     best_t = 0.5
     best_diff = float("inf")
 
-    for level, t in LEVEL_TO_T.items():
-        default_L = generate_lightness(t)
+    for (level, t), default_L in zip(_LEVEL_T_PAIRS, _DEFAULT_LIGHTNESS):
         diff = abs(default_L - anchor_L)
         if diff < best_diff:
             best_diff = diff
@@ -443,6 +530,20 @@ def find_anchor_level(anchor_L: float) -> Tuple[int, float]:
     return best_level, best_t
 
 
+def _ease_pow(x: float, power: float) -> float:
+    """
+    x**power for x in [0, 1], with the common easing exponents special-cased.
+
+    1.5 (the anchored-lightness default) and 2.0 avoid the libm pow() call;
+    any other exponent falls back to pow().
+    """
+    if power == 1.5:
+        return x * math.sqrt(x)
+    if power == 2.0:
+        return x * x
+    return pow(x, power)
+
+
 def generate_lightness_anchored(
     t: float,
     anchor_L: float,
@@ -478,7 +579,7 @@ def generate_lightness_anchored(
             return anchor_L
         local_t = t / 1.0
         # easeOut for full range
-        eased = 1.0 - pow(1.0 - local_t, power)
+        eased = 1.0 - _ease_pow(1.0 - local_t, power)
         return anchor_L + (L_DARK - anchor_L) * eased
 
     if anchor_t > 1.0 - 1e-9:
@@ -487,21 +588,62 @@ def generate_lightness_anchored(
             return anchor_L
         local_t = t / 1.0
         # easeIn for full range
-        eased = pow(local_t, power)
+        eased = _ease_pow(local_t, power)
         return L_LIGHT + (anchor_L - L_LIGHT) * eased
 
     if t <= anchor_t:
         # Interpolate from light end to anchor using easeIn
         local_t = t / anchor_t
-        eased = pow(local_t, power)
+        eased = _ease_pow(local_t, power)
         return L_LIGHT + (anchor_L - L_LIGHT) * eased
     else:
         # Interpolate from anchor to dark end using easeOut
         local_t = (t - anchor_t) / (1.0 - anchor_t)
-        eased = 1.0 - pow(1.0 - local_t, power)
+        eased = 1.0 - _ease_pow(1.0 - local_t, power)
         return anchor_L + (L_DARK - anchor_L) * eased
 
 
+def generate_lightness_anchored_levels(
+    anchor_L: float,
+    anchor_t: float,
+    power: float = 1.5,
+) -> Tuple[float, ...]:
+    """
+    generate_lightness_anchored evaluated at every level, in LEVELS order.
+
+    The extreme-anchor cases are decided once per scale, and the common
+    interior case runs the light/dark branches without the per-call
+    edge checks.
+
+    Args:
+        anchor_L: Lightness at anchor point
+        anchor_t: Position of anchor (0-1)
+        power: Easing power (see generate_lightness_anchored)
+
+    Returns:
+        Lightness for each level (50-950)
+    """
+    if anchor_t < 1e-9 or anchor_t > 1.0 - 1e-9:
+        return tuple(
+            generate_lightness_anchored(t, anchor_L, anchor_t, power)
+            for _, t in _LEVEL_T_PAIRS
+        )
+
+    L_LIGHT = 0.96
+    L_DARK = 0.25
+    light_span = anchor_L - L_LIGHT
+    dark_span = L_DARK - anchor_L
+    dark_range = 1.0 - anchor_t
+
+    return tuple(
+        L_LIGHT + light_span * _ease_pow(t / anchor_t, power)
+        if t <= anchor_t
+        else anchor_L
+        + dark_span * (1.0 - _ease_pow(1.0 - (t - anchor_t) / dark_range, power))
+        for _, t in _LEVEL_T_PAIRS
+    )
+
+
 def generate_chroma_anchored(
     t: float,
     anchor_C: float,
@@ -591,7 +733,7 @@ def generate_hue_shifted(
         else:
             shift = 0.0
 
-    return mod360(anchor_H + shift)
+    return (anchor_H + shift) % 360.0
 
 
 def generate_chroma_colorbox(
@@ -727,6 +869,27 @@ def generate_color_chroma(
     return base_chroma * chroma_envelope(t)
 
 
+def _clip_chroma_to_p3(
+    L: float, C: float, H: float
+) -> Tuple[
+    float, Tuple[float, float, float, bool], Tuple[float, float, float, bool]
+]:
+    """
+    Reduce an out-of-P3 chroma to 98% of the P3 boundary and convert again.
+
+    C is known to be outside P3 here, so C > cmax and the 98% margin always
+    moves it by at least ~2% of cmax. The first-pass RGB values can never
+    stand in for the clipped color, and the re-conversion is always needed.
+
+    Returns:
+        (clipped C, P3 result, sRGB result) as from oklch_to_p3_and_srgb
+    """
+    c_max = cmax_for_L_h(L, H, "p3") * 0.98
+    C = min(C, c_max)
+    p3, srgb = oklch_to_p3_and_srgb(L, C, H)
+    return C, p3, srgb
+
+
 def compute_scale(
     name: str,
     oklch_hue: float,
@@ -756,8 +919,7 @@ def compute_scale(
     L_DARK_NEUTRAL = 0.12  # Near-black for neutrals
     L_DARK_COLOR = 0.25  # Retains visible hue for colors
 
-    for level in LEVELS:
-        t = LEVEL_TO_T[level]
+    for level, t in _LEVEL_T_PAIRS:
 
         # Compute L - neutrals go darker than colors
         if is_neutral:
@@ -778,26 +940,25 @@ def compute_scale(
             oklch_h=oklch_hue,
         )
 
-        # Compute P3 values
-        p3_r, p3_g, p3_b, p3_in_gamut = oklch_to_p3(L, C, oklch_hue)
-        color.p3_r = p3_r
-        color.p3_g = p3_g
-        color.p3_b = p3_b
-        color.p3_in_gamut = p3_in_gamut
+        # Compute P3 values and sRGB fallback together. Colors outside P3
+        # are clipped below, so skip gamut-mapping them on this first pass.
+        converted = oklch_to_p3_and_srgb(L, C, oklch_hue, map_out_of_gamut=False)
 
         # If out of P3 gamut, reduce chroma
-        if not p3_in_gamut:
-            c_max = cmax_for_L_h(L, oklch_hue, "p3") * 0.98
-            C = min(C, c_max)
+        if converted is None:
+            C, p3, srgb = _clip_chroma_to_p3(L, C, oklch_hue)
             color.oklch_c = C
-            p3_r, p3_g, p3_b, _ = oklch_to_p3(L, C, oklch_hue)
-            color.p3_r = p3_r
-            color.p3_g = p3_g
-            color.p3_b = p3_b
-            color.p3_in_gamut = True
-
-        # Compute sRGB fallback
-        srgb_r, srgb_g, srgb_b, srgb_in_gamut = oklch_to_srgb(L, C, oklch_hue)
+            p3_in_gamut = True
+        else:
+            p3, srgb = converted
+            p3_in_gamut = p3[3]
+
+        color.p3_r = p3[0]
+        color.p3_g = p3[1]
+        color.p3_b = p3[2]
+        color.p3_in_gamut = p3_in_gamut
+
+        srgb_r, srgb_g, srgb_b, srgb_in_gamut = srgb
         color.srgb_r = srgb_r
         color.srgb_g = srgb_g
         color.srgb_b = srgb_b
@@ -807,7 +968,7 @@ def compute_scale(
         if not srgb_in_gamut:
             color.srgb_was_clipped = True
 
-        scale.colors[level] = color
+        scale.colors[_LEVEL_TO_IDX[level]] = color
 
     return scale
 
@@ -839,16 +1000,16 @@ def compute_scale_anchored(
     """
     scale = ColorScale(name=name, oklch_hue=anchor_H)
     anchor_t = LEVEL_TO_T[anchor_level]
+    lightness = generate_lightness_anchored_levels(anchor_L, anchor_t)
 
-    for level in LEVELS:
-        t = LEVEL_TO_T[level]
+    for (level, t), curve_L in zip(_LEVEL_T_PAIRS, lightness):
 
         if level == anchor_level:
             # Use EXACT anchor values
             L, C = anchor_L, anchor_C
         else:
             # Generate from anchored curves
-            L = generate_lightness_anchored(t, anchor_L, anchor_t)
+            L = curve_L
             C = generate_chroma_anchored(t, anchor_C, anchor_t)
 
         H = anchor_H
@@ -861,32 +1022,78 @@ def compute_scale_anchored(
             oklch_h=H,
         )
 
-        # Compute P3 values
-        p3_r, p3_g, p3_b, p3_in_gamut = oklch_to_p3(L, C, H)
-        color.p3_r, color.p3_g, color.p3_b = p3_r, p3_g, p3_b
-        color.p3_in_gamut = p3_in_gamut
+        # Compute P3 values and sRGB fallback together. Non-anchor colors
+        # outside P3 are clipped below, so only the anchor is gamut-mapped.
+        converted = oklch_to_p3_and_srgb(L, C, H, map_out_of_gamut=level == anchor_level)
 
         # Gamut clipping for non-anchor levels
-        if not p3_in_gamut and level != anchor_level:
-            c_max = cmax_for_L_h(L, H, "p3") * 0.98
-            C = min(C, c_max)
+        if converted is None:
+            C, p3, srgb = _clip_chroma_to_p3(L, C, H)
             color.oklch_c = C
-            p3_r, p3_g, p3_b, _ = oklch_to_p3(L, C, H)
-            color.p3_r, color.p3_g, color.p3_b = p3_r, p3_g, p3_b
-            color.p3_in_gamut = True
+            p3_in_gamut = True
+        else:
+            p3, srgb = converted
+            p3_in_gamut = p3[3]
+
+        color.p3_r, color.p3_g, color.p3_b = p3[0], p3[1], p3[2]
+        color.p3_in_gamut = p3_in_gamut
 
-        # Compute sRGB fallback
-        srgb_r, srgb_g, srgb_b, srgb_in_gamut = oklch_to_srgb(L, C, H)
+        srgb_r, srgb_g, srgb_b, srgb_in_gamut = srgb
         color.srgb_r, color.srgb_g, color.srgb_b = srgb_r, srgb_g, srgb_b
         color.srgb_in_gamut = srgb_in_gamut
         if not srgb_in_gamut:
             color.srgb_was_clipped = True
 
-        scale.colors[level] = color
+        scale.colors[_LEVEL_TO_IDX[level]] = color
 
     return scale
 
 
+def _colorbox_scale_lch(
+    anchor_L: float,
+    anchor_C: float,
+    anchor_H: float,
+    anchor_level: int,
+    gamut: Gamut,
+    hue_shift: bool,
+    light_hue_shift: float,
+    dark_hue_shift: float,
+) -> List[Tuple[int, float, float, float]]:
+    """
+    Numeric core of compute_scale_colorbox: per-level OKLCH values only.
+
+    Kept free of ColorValue construction so the curve math runs as one
+    tight loop and can be reused without building full scale objects.
+
+    Returns:
+        List of (level, L, C, H) tuples in level order
+    """
+    anchor_t = LEVEL_TO_T[anchor_level]
+    # Lightness (piecewise easeInOut through anchor)
+    lightness = generate_lightness_anchored_levels(anchor_L, anchor_t)
+    result = []
+
+    for (level, t), L in zip(_LEVEL_T_PAIRS, lightness):
+        if level == anchor_level:
+            # Use EXACT anchor values
+            result.append((level, anchor_L, anchor_C, anchor_H))
+            continue
+
+        # Generate hue with optional asymmetric shift
+        if hue_shift:
+            H = generate_hue_shifted(
+                t, anchor_H, anchor_t, light_hue_shift, dark_hue_shift
+            )
+        else:
+            H = anchor_H
+
+        # Generate chroma using ColorBox bell-curve pattern
+        C = generate_chroma_colorbox(t, anchor_C, anchor_t, L, H, gamut)
+        result.append((level, L, C, H))
+
+    return result
+
+
 def compute_scale_colorbox(
     name: str,
     anchor_L: float,
@@ -921,30 +1128,59 @@ def compute_scale_colorbox(
     Returns:
         ColorScale with ColorBox-style curves
     """
-    scale = ColorScale(name=name, oklch_hue=anchor_H)
-    anchor_t = LEVEL_TO_T[anchor_level]
+    return compute_palette_scales(
+        [(name, anchor_L, anchor_C, anchor_H, anchor_level)],
+        gamut,
+        hue_shift=hue_shift,
+        light_hue_shift=light_hue_shift,
+        dark_hue_shift=dark_hue_shift,
+    )[0]
 
-    for level in LEVELS:
-        t = LEVEL_TO_T[level]
 
-        if level == anchor_level:
-            # Use EXACT anchor values
-            L, C, H = anchor_L, anchor_C, anchor_H
-        else:
-            # Generate lightness (piecewise easeInOut through anchor)
-            L = generate_lightness_anchored(t, anchor_L, anchor_t)
+def compute_palette_scales(
+    anchors: List[Tuple[str, float, float, float, int]],
+    gamut: Gamut,
+    hue_shift: bool = True,
+    light_hue_shift: float = -16.0,
+    dark_hue_shift: float = 31.0,
+) -> List[ColorScale]:
+    """
+    Generate several ColorBox-style scales in a single pass.
 
-            # Generate hue with optional asymmetric shift
-            if hue_shift:
-                H = generate_hue_shifted(
-                    t, anchor_H, anchor_t, light_hue_shift, dark_hue_shift
-                )
-            else:
-                H = anchor_H
+    The curve math runs per scale first; the resulting (scale, level)
+    samples are then converted to P3/sRGB in one flat loop, and only the
+    samples that fall outside P3 are clipped and converted again.
+
+    Args:
+        anchors: List of (name, anchor_L, anchor_C, anchor_H, anchor_level)
+        gamut: Target gamut ("p3" or "srgb")
+        hue_shift: Whether to shift hue across each scale
+        light_hue_shift: Hue shift at light end (default -16° toward cyan)
+        dark_hue_shift: Hue shift at dark end (default +31° toward blue)
 
-            # Generate chroma using ColorBox bell-curve pattern
-            C = generate_chroma_colorbox(t, anchor_C, anchor_t, L, H, gamut)
+    Returns:
+        ColorScales in the same order as anchors
+    """
+    scales: List[ColorScale] = []
+    samples: List[Tuple[ColorScale, int, float, float, float, bool]] = []
+
+    for name, anchor_L, anchor_C, anchor_H, anchor_level in anchors:
+        scale = ColorScale(name=name, oklch_hue=anchor_H)
+        scales.append(scale)
+        levels_lch = _colorbox_scale_lch(
+            anchor_L,
+            anchor_C,
+            anchor_H,
+            anchor_level,
+            gamut,
+            hue_shift,
+            light_hue_shift,
+            dark_hue_shift,
+        )
+        for level, L, C, H in levels_lch:
+            samples.append((scale, level, L, C, H, level == anchor_level))
 
+    for scale, level, L, C, H, is_anchor in samples:
         # Create color value
         color = ColorValue(
             level=level,
@@ -953,30 +1189,31 @@ def compute_scale_colorbox(
             oklch_h=H,
         )
 
-        # Compute P3 values
-        p3_r, p3_g, p3_b, p3_in_gamut = oklch_to_p3(L, C, H)
-        color.p3_r, color.p3_g, color.p3_b = p3_r, p3_g, p3_b
-        color.p3_in_gamut = p3_in_gamut
+        # Compute P3 values and sRGB fallback together. Non-anchor colors
+        # outside P3 are clipped below, so only the anchor is gamut-mapped.
+        converted = oklch_to_p3_and_srgb(L, C, H, map_out_of_gamut=is_anchor)
 
         # Gamut clipping for non-anchor levels
-        if not p3_in_gamut and level != anchor_level:
-            c_max = cmax_for_L_h(L, H, "p3") * 0.98
-            C = min(C, c_max)
+        if converted is None:
+            C, p3, srgb = _clip_chroma_to_p3(L, C, H)
             color.oklch_c = C
-            p3_r, p3_g, p3_b, _ = oklch_to_p3(L, C, H)
-            color.p3_r, color.p3_g, color.p3_b = p3_r, p3_g, p3_b
-            color.p3_in_gamut = True
+            p3_in_gamut = True
+        else:
+            p3, srgb = converted
+            p3_in_gamut = p3[3]
+
+        color.p3_r, color.p3_g, color.p3_b = p3[0], p3[1], p3[2]
+        color.p3_in_gamut = p3_in_gamut
 
-        # Compute sRGB fallback
-        srgb_r, srgb_g, srgb_b, srgb_in_gamut = oklch_to_srgb(L, C, H)
+        srgb_r, srgb_g, srgb_b, srgb_in_gamut = srgb
         color.srgb_r, color.srgb_g, color.srgb_b = srgb_r, srgb_g, srgb_b
         color.srgb_in_gamut = srgb_in_gamut
         if not srgb_in_gamut:
             color.srgb_was_clipped = True
 
-        scale.colors[level] = color
+        scale.colors[_LEVEL_TO_IDX[level]] = color
 
-    return scale
+    return scales
 
 
 def compute_even_chroma(
@@ -990,10 +1227,11 @@ def compute_even_chroma(
     """
     L_peak = generate_lightness(0.5)  # Level 500
 
-    min_cmax = float("inf")
-    for h in hues:
-        cmax = cmax_for_L_h(L_peak, h, gamut)
-        min_cmax = min(min_cmax, cmax)
+    if len(hues) == 1:
+        # A single hue is its own minimum
+        return cmax_for_L_h(L_peak, hues[0], gamut) * 0.95
+
+    min_cmax = min(cmax_for_L_hues(L_peak, hues, gamut), default=float("inf"))
 
     # Apply safety margin
     return min_cmax * 0.95
@@ -1002,6 +1240,36 @@ def compute_even_chroma(
 # ========== Palette Building ==========
 
 
+def compute_palette_apca(palette: Palette) -> None:
+    """
+    Fill in APCA contrast against the neutral backgrounds for every color.
+
+    Uses P3 values and coefficients for P3 palettes, sRGB otherwise. All
+    colors of the palette are collected once and scored in a single batch
+    per background. Does nothing if the backgrounds are not set yet.
+    """
+    if palette.gamut == "p3":
+        light_bg = palette.neutral_light_bg_p3
+        dark_bg = palette.neutral_dark_bg_p3
+    else:
+        light_bg = palette.neutral_light_bg
+        dark_bg = palette.neutral_dark_bg
+    if not light_bg or not dark_bg:
+        return
+
+    colors = [color for scale in palette.scales.values() for color in scale.colors]
+    if palette.gamut == "p3":
+        rgbs = [c.p3_tuple for c in colors]
+    else:
+        rgbs = [c.srgb_tuple for c in colors]
+
+    light = calc_apca_batch(rgbs, light_bg, palette.gamut)
+    dark = calc_apca_batch(rgbs, dark_bg, palette.gamut)
+    for color, lc_light, lc_dark in zip(colors, light, dark):
+        color.apca_vs_light_bg = lc_light
+        color.apca_vs_dark_bg = lc_dark
+
+
 def build_ryb_palette_hues(
     H_base_ryb: float,
     mode: str,
@@ -1026,17 +1294,60 @@ def build_ryb_palette_hues(
         parts.append(("split-complement-cool", mod360(H_base_ryb + 180.0 - x_deg)))
         parts.append(("split-complement-warm", mod360(H_base_ryb + 180.0 + x_deg)))
 
-    # Dedupe by hue
+    # Dedupe by hue, compared at millidegree resolution (hues are already
+    # in [0, 360), the modulo folds 359.9995+ onto 0)
     out: List[Tuple[str, float]] = []
-    seen: List[float] = []
+    seen: Set[int] = set()
     for lab, h in parts:
-        if not any(abs(((h - s + 540.0) % 360.0) - 180.0) < 1e-7 for s in seen):
+        key = round(h * 1000.0) % 360000
+        if key not in seen:
             out.append((lab, h))
-            seen.append(h)
+            seen.add(key)
 
     return out
 
 
+def _palette_hue_context(
+    hue_weights: List[Tuple[str, float]],
+    palette_set: str,
+    x_deg: float,
+    include_complementary: bool,
+) -> Tuple[List[Tuple[str, float]], float]:
+    """
+    Resolve the scale hues shared by every chroma mode of a palette.
+
+    Returns:
+        ([(scale_name, oklch_hue), ...], primary HSB hue for the neutrals)
+    """
+    # Compute weighted primary RYB hue
+    hues_deg = [RYB_ANCHOR_DEG[name] for name, _ in hue_weights]
+    weights = [w for _, w in hue_weights]
+    if len(hues_deg) == 1:
+        H_ryb = hues_deg[0]
+    else:
+        H_ryb = circular_mean_deg(hues_deg, weights)
+        if H_ryb is None:
+            # Weighted hues cancel out, so there is no mean; keep the first
+            H_ryb = hues_deg[0]
+
+    # Build palette hues (RYB)
+    ryb_hues = build_ryb_palette_hues(H_ryb, palette_set, x_deg, include_complementary)
+
+    # Convert to OKLCH hues and get HSB hues
+    oklch_hues: List[Tuple[str, float]] = []
+    hsb_hues: List[Tuple[str, float]] = []
+    for name, h_ryb in ryb_hues:
+        h_rgb = ryb_hue_to_rgb_hue(h_ryb)  # RGB hue = HSB hue
+        h_oklch = rgb_hue_to_oklch_hue_deg(h_rgb)
+        oklch_hues.append((name, h_oklch))
+        hsb_hues.append((name, h_rgb))
+
+    # Primary HSB hue for ColorBox neutral generation
+    primary_hsb_hue = hsb_hues[0][1] if hsb_hues else 0.0
+
+    return oklch_hues, primary_hsb_hue
+
+
 def generate_palette(
     hue_weights: List[Tuple[str, float]],  # [(name, weight), ...]
     chroma_mode: ChromaMode,
@@ -1061,26 +1372,46 @@ def generate_palette(
     Returns:
         Palette with all scales computed
     """
-    # Compute weighted primary RYB hue
-    hues_deg = [RYB_ANCHOR_DEG[name] for name, _ in hue_weights]
-    weights = [w for _, w in hue_weights]
-    H_ryb = circular_mean_deg(hues_deg, weights)
+    oklch_hues, primary_hsb_hue = _palette_hue_context(
+        hue_weights, palette_set, x_deg, include_complementary
+    )
+    return _materialize_palette(oklch_hues, primary_hsb_hue, chroma_mode, gamut)
 
-    # Build palette hues (RYB)
-    ryb_hues = build_ryb_palette_hues(H_ryb, palette_set, x_deg, include_complementary)
 
-    # Convert to OKLCH hues and get HSB hues
-    oklch_hues: List[Tuple[str, float]] = []
-    hsb_hues: List[Tuple[str, float]] = []
-    for name, h_ryb in ryb_hues:
-        h_rgb = ryb_hue_to_rgb_hue(h_ryb)  # RGB hue = HSB hue
-        h_oklch = rgb_hue_to_oklch_hue_deg(h_rgb)
-        oklch_hues.append((name, h_oklch))
-        hsb_hues.append((name, h_rgb))
+def generate_even_and_max_palettes(
+    hue_weights: List[Tuple[str, float]],
+    gamut: Gamut,
+    palette_set: str = "full",
+    x_deg: float = 30.0,
+    include_complementary: bool = False,
+) -> Tuple[Palette, Palette]:
+    """
+    Generate the even- and max-chroma palettes for the same hue weights.
 
-    # Primary HSB hue for ColorBox neutral generation
-    primary_hsb_hue = hsb_hues[0][1] if hsb_hues else 0.0
+    Same as two generate_palette() calls, but the hue resolution is shared.
+    The two palettes are built one after the other: each takes a few tens of
+    milliseconds, less than a worker process would need just to import
+    coloraide.
 
+    Returns:
+        (even palette, max palette)
+    """
+    oklch_hues, primary_hsb_hue = _palette_hue_context(
+        hue_weights, palette_set, x_deg, include_complementary
+    )
+    return (
+        _materialize_palette(oklch_hues, primary_hsb_hue, "even", gamut),
+        _materialize_palette(oklch_hues, primary_hsb_hue, "max", gamut),
+    )
+
+
+def _materialize_palette(
+    oklch_hues: List[Tuple[str, float]],
+    primary_hsb_hue: float,
+    chroma_mode: ChromaMode,
+    gamut: Gamut,
+) -> Palette:
+    """Build the scales and APCA values of a palette from its resolved hues."""
     # Create palette
     palette = Palette(chroma_mode=chroma_mode, gamut=gamut)
 
@@ -1098,63 +1429,46 @@ def generate_palette(
     palette.scales["neutral"] = neutral_scale
 
     # Extract neutral backgrounds for APCA (both sRGB and P3)
-    neutral_50 = neutral_scale.colors[50]
-    neutral_950 = neutral_scale.colors[950]
-    palette.neutral_light_bg = (neutral_50.srgb_r, neutral_50.srgb_g, neutral_50.srgb_b)
-    palette.neutral_dark_bg = (
-        neutral_950.srgb_r,
-        neutral_950.srgb_g,
-        neutral_950.srgb_b,
-    )
-    palette.neutral_light_bg_p3 = (neutral_50.p3_r, neutral_50.p3_g, neutral_50.p3_b)
-    palette.neutral_dark_bg_p3 = (neutral_950.p3_r, neutral_950.p3_g, neutral_950.p3_b)
+    neutral_50 = neutral_scale.color(50)
+    neutral_950 = neutral_scale.color(950)
+    palette.neutral_light_bg = neutral_50.srgb_tuple
+    palette.neutral_dark_bg = neutral_950.srgb_tuple
+    palette.neutral_light_bg_p3 = neutral_50.p3_tuple
+    palette.neutral_dark_bg_p3 = neutral_950.p3_tuple
 
     # Step 2: Compute chroma for color scales
     all_oklch_hues = [h for _, h in oklch_hues]
 
-    if chroma_mode == "even":
-        even_chroma = compute_even_chroma(all_oklch_hues, gamut)
-        chroma_values = {name: even_chroma for name, _ in oklch_hues}
-    elif chroma_mode == "max":
+    if chroma_mode == "max":
         L_peak = generate_lightness(0.5)
+        cmaxes = cmax_for_L_hues(L_peak, all_oklch_hues, gamut)
         chroma_values = {
-            name: cmax_for_L_h(L_peak, h, gamut) * 0.95 for name, h in oklch_hues
+            name: cmax * 0.95 for (name, _), cmax in zip(oklch_hues, cmaxes)
         }
-    else:  # "both" - we'll generate two sets
+    else:
+        # "even", and "both": for "both" we return even mode; caller
+        # handles max separately
         even_chroma = compute_even_chroma(all_oklch_hues, gamut)
-        L_peak = generate_lightness(0.5)
-        # For "both", we return even mode; caller handles max separately
         chroma_values = {name: even_chroma for name, _ in oklch_hues}
 
     # Step 3: Generate color scales
-    for name, h_oklch in oklch_hues:
-        scale = compute_scale(
-            name=name,
-            oklch_hue=h_oklch,
-            chroma_at_peak=chroma_values[name],
-            gamut=gamut,
-            is_neutral=False,
+    palette.scales.update(
+        (
+            name,
+            compute_scale(
+                name=name,
+                oklch_hue=h_oklch,
+                chroma_at_peak=chroma_values[name],
+                gamut=gamut,
+                is_neutral=False,
+            ),
         )
-        palette.scales[name] = scale
+        for name, h_oklch in oklch_hues
+    )
 
     # Step 4: Compute APCA contrast for all colors
     # Use gamut-appropriate values and coefficients
-    for scale in palette.scales.values():
-        for color in scale.colors.values():
-            if gamut == "p3":
-                # Use P3 values with P3 APCA coefficients
-                color_rgb = (color.p3_r, color.p3_g, color.p3_b)
-                light_bg = palette.neutral_light_bg_p3
-                dark_bg = palette.neutral_dark_bg_p3
-                color.apca_vs_light_bg = calc_apca_p3(color_rgb, light_bg)
-                color.apca_vs_dark_bg = calc_apca_p3(color_rgb, dark_bg)
-            else:
-                # Use sRGB values with sRGB APCA coefficients
-                color_rgb = (color.srgb_r, color.srgb_g, color.srgb_b)
-                light_bg = palette.neutral_light_bg
-                dark_bg = palette.neutral_dark_bg
-                color.apca_vs_light_bg = calc_apca_from_rgb01(color_rgb, light_bg)
-                color.apca_vs_dark_bg = calc_apca_from_rgb01(color_rgb, dark_bg)
+    compute_palette_apca(palette)
 
     return palette
 
@@ -1217,16 +1531,12 @@ def generate_palette_from_brand_color(
     palette.scales["neutral"] = neutral_scale
 
     # Extract neutral backgrounds for APCA
-    neutral_50 = neutral_scale.colors[50]
-    neutral_950 = neutral_scale.colors[950]
-    palette.neutral_light_bg = (neutral_50.srgb_r, neutral_50.srgb_g, neutral_50.srgb_b)
-    palette.neutral_dark_bg = (
-        neutral_950.srgb_r,
-        neutral_950.srgb_g,
-        neutral_950.srgb_b,
-    )
-    palette.neutral_light_bg_p3 = (neutral_50.p3_r, neutral_50.p3_g, neutral_50.p3_b)
-    palette.neutral_dark_bg_p3 = (neutral_950.p3_r, neutral_950.p3_g, neutral_950.p3_b)
+    neutral_50 = neutral_scale.color(50)
+    neutral_950 = neutral_scale.color(950)
+    palette.neutral_light_bg = neutral_50.srgb_tuple
+    palette.neutral_dark_bg = neutral_950.srgb_tuple
+    palette.neutral_light_bg_p3 = neutral_50.p3_tuple
+    palette.neutral_dark_bg_p3 = neutral_950.p3_tuple
 
     # Step 2: Generate color scales with ColorBox curves
     # For "even" mode, compute minimum achievable chroma across all hues at anchor L
@@ -1234,12 +1544,12 @@ def generate_palette_from_brand_color(
     even_chroma: float = 0.0
     if chroma_mode == "even":
         all_hues = [brand_result.oklch_hues[lab] for lab in brand_result.labels]
-        min_cmax = float("inf")
-        for h in all_hues:
-            cmax = cmax_for_L_h(brand_result.L, h, gamut)
-            min_cmax = min(min_cmax, cmax)
+        min_cmax = min(
+            cmax_for_L_hues(brand_result.L, all_hues, gamut), default=float("inf")
+        )
         even_chroma = min_cmax * 0.95  # Use minimum max chroma across all hues
 
+    anchors: List[Tuple[str, float, float, float, int]] = []
     for label in brand_result.labels:
         oklch_hue = brand_result.oklch_hues[label]
         scale_name = map_name(label)  # "base" -> "primary", etc.
@@ -1263,42 +1573,21 @@ def generate_palette_from_brand_color(
             anchor_C = even_chroma
             scale_anchor_level = anchor_level
 
-        scale = compute_scale_colorbox(
-            name=scale_name,
-            anchor_L=scale_anchor_L,
-            anchor_C=anchor_C,
-            anchor_H=oklch_hue,
-            anchor_level=scale_anchor_level,
-            gamut=gamut,
-            hue_shift=hue_shift,
-            light_hue_shift=light_hue_shift,
-            dark_hue_shift=dark_hue_shift,
+        anchors.append(
+            (scale_name, scale_anchor_L, anchor_C, oklch_hue, scale_anchor_level)
         )
-        palette.scales[scale_name] = scale
+
+    scales = compute_palette_scales(
+        anchors,
+        gamut,
+        hue_shift=hue_shift,
+        light_hue_shift=light_hue_shift,
+        dark_hue_shift=dark_hue_shift,
+    )
+    palette.scales.update((scale.name, scale) for scale in scales)
 
     # Step 3: Compute APCA contrast for all colors
-    for scale in palette.scales.values():
-        for color in scale.colors.values():
-            if (
-                gamut == "p3"
-                and palette.neutral_light_bg_p3
-                and palette.neutral_dark_bg_p3
-            ):
-                color_rgb = (color.p3_r, color.p3_g, color.p3_b)
-                color.apca_vs_light_bg = calc_apca_p3(
-                    color_rgb, palette.neutral_light_bg_p3
-                )
-                color.apca_vs_dark_bg = calc_apca_p3(
-                    color_rgb, palette.neutral_dark_bg_p3
-                )
-            elif palette.neutral_light_bg and palette.neutral_dark_bg:
-                color_rgb = (color.srgb_r, color.srgb_g, color.srgb_b)
-                color.apca_vs_light_bg = calc_apca_from_rgb01(
-                    color_rgb, palette.neutral_light_bg
-                )
-                color.apca_vs_dark_bg = calc_apca_from_rgb01(
-                    color_rgb, palette.neutral_dark_bg
-                )
+    compute_palette_apca(palette)
 
     return palette
 
@@ -1306,7 +1595,7 @@ def generate_palette_from_brand_color(
 # ========== APCA Validation ==========
 
 
-@dataclass
+@dataclass(slots=True)
 class ContrastIssue:
     """A contrast issue found during validation."""
 
@@ -1317,7 +1606,7 @@ class ContrastIssue:
     required_lc: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ContrastAdjustment:
     """Record of an APCA contrast adjustment."""
 
@@ -1353,63 +1642,23 @@ def validate_palette_contrast(
         if scale_name == "neutral":
             continue  # Skip neutrals (they ARE the background)
 
-        for level, color in scale.colors.items():
-            # Light levels (50-400) should contrast against dark background
-            # Dark levels (600-950) should contrast against light background
-            # Level 500 should work against both
-
-            if level <= 400:
-                # Check against dark background
-                if color.apca_vs_dark_bg is not None:
-                    if abs(color.apca_vs_dark_bg) < min_lc:
-                        issues.append(
-                            ContrastIssue(
-                                scale_name=scale_name,
-                                level=level,
-                                background="dark",
-                                actual_lc=abs(color.apca_vs_dark_bg),
-                                required_lc=min_lc,
-                            )
-                        )
-
-            if level >= 600:
-                # Check against light background
-                if color.apca_vs_light_bg is not None:
-                    if abs(color.apca_vs_light_bg) < min_lc:
-                        issues.append(
-                            ContrastIssue(
-                                scale_name=scale_name,
-                                level=level,
-                                background="light",
-                                actual_lc=abs(color.apca_vs_light_bg),
-                                required_lc=min_lc,
-                            )
-                        )
-
-            if level == 500:
-                # Check against both
-                if color.apca_vs_light_bg is not None:
-                    if abs(color.apca_vs_light_bg) < min_lc:
-                        issues.append(
-                            ContrastIssue(
-                                scale_name=scale_name,
-                                level=level,
-                                background="light",
-                                actual_lc=abs(color.apca_vs_light_bg),
-                                required_lc=min_lc,
-                            )
-                        )
-                if color.apca_vs_dark_bg is not None:
-                    if abs(color.apca_vs_dark_bg) < min_lc:
-                        issues.append(
-                            ContrastIssue(
-                                scale_name=scale_name,
-                                level=level,
-                                background="dark",
-                                actual_lc=abs(color.apca_vs_dark_bg),
-                                required_lc=min_lc,
-                            )
+        for level, color in zip(LEVELS, scale.colors):
+            for bg_name in LEVEL_CHECKS[level]:
+                lc = (
+                    color.apca_vs_light_bg
+                    if bg_name == "light"
+                    else color.apca_vs_dark_bg
+                )
+                if lc is not None and abs(lc) < min_lc:
+                    issues.append(
+                        ContrastIssue(
+                            scale_name=scale_name,
+                            level=level,
+                            background=bg_name,
+                            actual_lc=abs(lc),
+                            required_lc=min_lc,
                         )
+                    )
 
     return issues
 
@@ -1444,51 +1693,55 @@ def auto_adjust_palette_contrast(
 
     adjustments: List[ContrastAdjustment] = []
 
+    # Select appropriate backgrounds and APCA method based on gamut
+    if palette.gamut == "p3":
+        light_bg = palette.neutral_light_bg_p3
+        dark_bg = palette.neutral_dark_bg_p3
+        color_rgb = attrgetter("p3_tuple")
+        to_gamut_rgb = oklch_to_p3
+    else:
+        light_bg = palette.neutral_light_bg
+        dark_bg = palette.neutral_dark_bg
+        color_rgb = attrgetter("srgb_tuple")
+        to_gamut_rgb = oklch_to_srgb
+    calc_apca = apca_func_for_gamut(palette.gamut)
+
+    # Background and adjustment direction per check: colors failing against
+    # the dark background get lighter, against the light one darker
+    targets = {"light": (light_bg, "darker"), "dark": (dark_bg, "lighter")}
+
     for scale_name, scale in palette.scales.items():
         if scale_name == "neutral":
             continue
 
-        for level, color in scale.colors.items():
+        for level, color in zip(LEVELS, scale.colors):
             # Determine which background to check and direction
             checks = []
+            for bg_name in LEVEL_CHECKS[level]:
+                lc = (
+                    color.apca_vs_light_bg
+                    if bg_name == "light"
+                    else color.apca_vs_dark_bg
+                )
+                if lc is not None and abs(lc) < min_lc:
+                    checks.append((bg_name, *targets[bg_name]))
 
-            # Select appropriate backgrounds based on gamut
-            if palette.gamut == "p3":
-                light_bg = palette.neutral_light_bg_p3
-                dark_bg = palette.neutral_dark_bg_p3
-            else:
-                light_bg = palette.neutral_light_bg
-                dark_bg = palette.neutral_dark_bg
-
-            if level <= 400:
-                # Light colors: check vs dark bg, adjust lighter if needed
-                if color.apca_vs_dark_bg is not None:
-                    if abs(color.apca_vs_dark_bg) < min_lc:
-                        checks.append(("dark", dark_bg, "lighter"))
-
-            if level >= 600:
-                # Dark colors: check vs light bg, adjust darker if needed
-                if color.apca_vs_light_bg is not None:
-                    if abs(color.apca_vs_light_bg) < min_lc:
-                        checks.append(("light", light_bg, "darker"))
-
-            if level == 500:
-                # Mid-tone: check both, prefer adjustment that works
-                if color.apca_vs_light_bg is not None:
-                    if abs(color.apca_vs_light_bg) < min_lc:
-                        checks.append(("light", light_bg, "darker"))
-                if color.apca_vs_dark_bg is not None:
-                    if abs(color.apca_vs_dark_bg) < min_lc:
-                        checks.append(("dark", dark_bg, "lighter"))
-
+            # Conversions and APCA are refreshed once per color, after all of
+            # its checks; `moved` marks that an earlier check changed it
+            moved = False
             for bg_name, bg_rgb, direction in checks:
                 L_old = color.oklch_l
                 C_old = color.oklch_c
-                apca_value = (
-                    color.apca_vs_dark_bg
-                    if bg_name == "dark"
-                    else color.apca_vs_light_bg
-                )
+                if moved:
+                    # Stored APCA is stale; score the color as it stands now
+                    r, g, b, _ = to_gamut_rgb(L_old, C_old, color.oklch_h)
+                    apca_value = calc_apca((r, g, b), bg_rgb)
+                else:
+                    apca_value = (
+                        color.apca_vs_dark_bg
+                        if bg_name == "dark"
+                        else color.apca_vs_light_bg
+                    )
                 lc_old = abs(apca_value) if apca_value is not None else 0.0
 
                 L_new, C_new, _, lc_new, success = auto_adjust_for_contrast(
@@ -1506,37 +1759,7 @@ def auto_adjust_palette_contrast(
                     # Update color values
                     color.oklch_l = L_new
                     color.oklch_c = C_new
-
-                    # Recompute P3/sRGB values
-                    p3_r, p3_g, p3_b, p3_in = oklch_to_p3(L_new, C_new, color.oklch_h)
-                    color.p3_r, color.p3_g, color.p3_b = p3_r, p3_g, p3_b
-                    color.p3_in_gamut = p3_in
-
-                    srgb_r, srgb_g, srgb_b, srgb_in = oklch_to_srgb(
-                        L_new, C_new, color.oklch_h
-                    )
-                    color.srgb_r, color.srgb_g, color.srgb_b = srgb_r, srgb_g, srgb_b
-                    color.srgb_in_gamut = srgb_in
-
-                    # Recompute APCA using gamut-appropriate method
-                    if palette.gamut == "p3":
-                        color.apca_vs_light_bg = calc_apca_p3(
-                            (color.p3_r, color.p3_g, color.p3_b),
-                            palette.neutral_light_bg_p3,
-                        )
-                        color.apca_vs_dark_bg = calc_apca_p3(
-                            (color.p3_r, color.p3_g, color.p3_b),
-                            palette.neutral_dark_bg_p3,
-                        )
-                    else:
-                        color.apca_vs_light_bg = calc_apca_from_rgb01(
-                            (color.srgb_r, color.srgb_g, color.srgb_b),
-                            palette.neutral_light_bg,
-                        )
-                        color.apca_vs_dark_bg = calc_apca_from_rgb01(
-                            (color.srgb_r, color.srgb_g, color.srgb_b),
-                            palette.neutral_dark_bg,
-                        )
+                    moved = True
 
                     adjustments.append(
                         ContrastAdjustment(
@@ -1553,6 +1776,19 @@ def auto_adjust_palette_contrast(
                         )
                     )
 
+            if moved:
+                L, C, H = color.oklch_l, color.oklch_c, color.oklch_h
+
+                # Recompute P3/sRGB values
+                p3, srgb = oklch_to_p3_and_srgb(L, C, H)
+                color.p3_r, color.p3_g, color.p3_b, color.p3_in_gamut = p3
+                color.srgb_r, color.srgb_g, color.srgb_b, color.srgb_in_gamut = srgb
+
+                # Recompute APCA using gamut-appropriate method
+                rgb = color_rgb(color)
+                color.apca_vs_light_bg = calc_apca(rgb, light_bg)
+                color.apca_vs_dark_bg = calc_apca(rgb, dark_bg)
+
     return adjustments
 
 
@@ -1576,40 +1812,33 @@ def print_adjustment_report(
 # ========== Output Formatting ==========
 
 
+def ordered_scale_names(palette: Palette) -> List[str]:
+    """Scale names in SCALE_ORDER, followed by any other scales in insertion order."""
+    return [name for name in SCALE_ORDER if name in palette.scales] + [
+        name for name in palette.scales if name not in SCALE_ORDER_SET
+    ]
+
+
 def format_palette_block(palette: Palette, gamut: Gamut = "p3") -> str:
     """
     Format palette as markdown code block.
 
     Each line: name: hex1, hex2, hex3, ... (11 values, 50->950)
     """
-    lines = ["```palette"]
-
-    # Order: primary first, then others, neutral last
-    scale_order = [
-        "primary",
-        "analogous-cool",
-        "analogous-warm",
-        "complement",
-        "split-complement-cool",
-        "split-complement-warm",
-        "neutral",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w("```palette\n")
 
-    for name in scale_order:
-        if name in palette.scales:
-            scale = palette.scales[name]
-            hex_list = scale.get_hex_list(gamut)
-            lines.append(f"{name}: {', '.join(hex_list)}")
+    for name in ordered_scale_names(palette):
+        hex_list = palette.scales[name].get_hex_list(gamut)
+        w(f"{name}: {', '.join(hex_list)}\n")
 
-    # Add any other scales not in the order
-    for name in palette.scales:
-        if name not in scale_order:
-            scale = palette.scales[name]
-            hex_list = scale.get_hex_list(gamut)
-            lines.append(f"{name}: {', '.join(hex_list)}")
+    w("```")
+    return buf.getvalue()
 
-    lines.append("```")
-    return "\n".join(lines)
+
+# One Tailwind config entry per level: level key and color value
+TAILWIND_LEVEL_TEMPLATE = "        %s: '%s',\n"
 
 
 def format_tailwind_config(palette: Palette, use_oklch: bool = True) -> str:
@@ -1618,55 +1847,39 @@ def format_tailwind_config(palette: Palette, use_oklch: bool = True) -> str:
 
     Uses oklch() for modern Tailwind, or hex for compatibility.
     """
-    lines = [
-        "module.exports = {",
-        "  theme: {",
-        "    colors: {",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w("module.exports = {\n  theme: {\n    colors: {\n")
 
-    scale_order = [
-        "primary",
-        "analogous-cool",
-        "analogous-warm",
-        "complement",
-        "split-complement-cool",
-        "split-complement-warm",
-        "neutral",
-    ]
+    value = attrgetter("css_oklch" if use_oklch else "hex_srgb")
 
-    def format_scale(name: str, scale: ColorScale) -> List[str]:
+    def write_scale(name: str, scale: ColorScale) -> None:
         # Handle names with hyphens for JS
         js_name = f"'{name}'" if "-" in name else name
 
-        scale_lines = [f"      {js_name}: {{"]
-        for level in LEVELS:
-            color = scale.colors.get(level)
-            if color:
-                if use_oklch:
-                    value = color.css_oklch
-                else:
-                    value = color.hex_srgb
-                scale_lines.append(f"        {level}: '{value}',")
-        scale_lines.append("      },")
-        return scale_lines
-
-    for name in scale_order:
-        if name in palette.scales:
-            lines.extend(format_scale(name, palette.scales[name]))
-
-    for name in palette.scales:
-        if name not in scale_order:
-            lines.extend(format_scale(name, palette.scales[name]))
-
-    lines.extend(
-        [
-            "    },",
-            "  },",
-            "};",
-        ]
-    )
+        w(f"      {js_name}: {{\n")
+        w(
+            "".join(
+                [
+                    TAILWIND_LEVEL_TEMPLATE % (key, value(color))
+                    for key, color in zip(LEVEL_KEYS, scale.colors)
+                    if color
+                ]
+            )
+        )
+        w("      },\n")
+
+    for name in ordered_scale_names(palette):
+        write_scale(name, palette.scales[name])
 
-    return "\n".join(lines)
+    w("    },\n  },\n};")
+
+    return buf.getvalue()
+
+
+def _round_optional(value: Optional[float], ndigits: int) -> Optional[float]:
+    """round() that passes None through (for unset APCA values)."""
+    return None if value is None else round(value, ndigits)
 
 
 def format_json(palette: Palette) -> str:
@@ -1689,13 +1902,24 @@ def format_json(palette: Palette) -> str:
             "levels": {},
         }
 
-        for level, color in scale.colors.items():
-            scale_data["levels"][str(level)] = {
-                "oklch": {
-                    "l": round(color.oklch_l, 4),
-                    "c": round(color.oklch_c, 4),
-                    "h": round(color.oklch_h, 2),
-                },
+        # Round every color's numeric fields in one pass, then fill the
+        # per-level dicts from the rounded rows
+        rounded = [
+            (
+                round(color.oklch_l, 4),
+                round(color.oklch_c, 4),
+                round(color.oklch_h, 2),
+                _round_optional(color.apca_vs_light_bg, 1),
+                _round_optional(color.apca_vs_dark_bg, 1),
+            )
+            for color in scale.colors
+        ]
+        levels = scale_data["levels"]
+        for key, color, (l, c, h, lc_light, lc_dark) in zip(
+            LEVEL_KEYS, scale.colors, rounded
+        ):
+            levels[key] = {
+                "oklch": {"l": l, "c": c, "h": h},
                 "p3": {
                     "hex": color.hex_p3,
                     "css": color.css_p3,
@@ -1706,18 +1930,7 @@ def format_json(palette: Palette) -> str:
                     "in_gamut": color.srgb_in_gamut,
                     "was_clipped": color.srgb_was_clipped,
                 },
-                "apca": {
-                    "vs_light_bg": (
-                        round(color.apca_vs_light_bg, 1)
-                        if color.apca_vs_light_bg is not None
-                        else None
-                    ),
-                    "vs_dark_bg": (
-                        round(color.apca_vs_dark_bg, 1)
-                        if color.apca_vs_dark_bg is not None
-                        else None
-                    ),
-                },
+                "apca": {"vs_light_bg": lc_light, "vs_dark_bg": lc_dark},
             }
 
         data["scales"][name] = scale_data
@@ -1739,47 +1952,34 @@ def format_css(palette: Palette, use_oklch: bool = True) -> str:
           ...
         }
     """
-    lines = [":root {"]
-
-    scale_order = [
-        "primary",
-        "analogous-cool",
-        "analogous-warm",
-        "complement",
-        "split-complement-cool",
-        "split-complement-warm",
-        "neutral",
-    ]
-
-    def format_scale(name: str, scale: ColorScale) -> List[str]:
-        scale_lines = [
-            f"  /* {name.title().replace('-', ' ')} scale (hue: {scale.oklch_hue:.0f}deg) */"
-        ]
-        for level in LEVELS:
-            color = scale.colors.get(level)
+    buf = io.StringIO()
+    w = buf.write
+    w(":root {\n")
+
+    first = True
+
+    def write_scale(name: str, scale: ColorScale) -> None:
+        nonlocal first
+        if not first:
+            w("\n")  # Blank line between scales
+        first = False
+        w(
+            f"  /* {name.title().replace('-', ' ')} scale (hue: {scale.oklch_hue:.0f}deg) */\n"
+        )
+        for key, color in zip(LEVEL_KEYS, scale.colors):
             if color:
                 if use_oklch:
                     value = color.css_oklch
                 else:
                     value = color.hex_srgb
-                scale_lines.append(f"  --color-{name}-{level}: {value};")
-        scale_lines.append("")  # Blank line between scales
-        return scale_lines
-
-    for name in scale_order:
-        if name in palette.scales:
-            lines.extend(format_scale(name, palette.scales[name]))
+                w(f"  --color-{name}-{key}: {value};\n")
 
-    for name in palette.scales:
-        if name not in scale_order:
-            lines.extend(format_scale(name, palette.scales[name]))
+    for name in ordered_scale_names(palette):
+        write_scale(name, palette.scales[name])
 
-    # Remove trailing blank line and close
-    if lines[-1] == "":
-        lines.pop()
-    lines.append("}")
+    w("}")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ========== Visualization Functions ==========
@@ -1793,46 +1993,27 @@ def format_blocks(palette: Palette, gamut: Gamut = "p3", use_color: bool = True)
         primary:  ██ ██ ██ ██ ██ ██ ██ ██ ██ ██ ██
                   50 100 200 300 400 500 600 700 800 900 950
     """
-    lines = []
-
-    scale_order = [
-        "primary",
-        "analogous-cool",
-        "analogous-warm",
-        "complement",
-        "split-complement-cool",
-        "split-complement-warm",
-        "neutral",
-    ]
+    buf = io.StringIO()
+    w = buf.write
 
-    for name in scale_order:
-        if name not in palette.scales:
-            continue
-        scale = palette.scales[name]
+    # Labels line is the same for every scale
+    labels = " ".join(f"{key:>3}" for key in LEVEL_KEYS)
+    cell_template = BG_CELL_TEMPLATE
 
+    for name, scale in palette.visible_scales():
         # Build blocks line
         blocks = []
-        for level in LEVELS:
-            color = scale.colors.get(level)
-            if color:
-                if gamut == "p3":
-                    r, g, b = rgb01_to_255(color.p3_r, color.p3_g, color.p3_b)
-                else:
-                    r, g, b = rgb01_to_255(color.srgb_r, color.srgb_g, color.srgb_b)
-
+        for rgb in scale.get_rgb255_list(gamut):
+            if rgb:
                 if use_color:
-                    blocks.append(f"{rgb_bg(r, g, b)}  {RESET}")
+                    blocks.append(cell_template % rgb)
                 else:
                     blocks.append("##")
 
-        # Build labels line
-        labels = [f"{level:>3}" for level in LEVELS]
-
-        lines.append(f"{name:>20}:  {' '.join(blocks)}")
-        lines.append(f"{'':>20}   {' '.join(labels)}")
-        lines.append("")
+        w(f"{name:>20}:  {' '.join(blocks)}\n")
+        w(f"{'':>20}   {labels}\n\n")
 
-    return "\n".join(lines).rstrip()
+    return buf.getvalue().rstrip()
 
 
 def format_colored_text(
@@ -1844,40 +2025,34 @@ def format_colored_text(
     Output:
         primary: #F5F5F5 #EAEFFF #D4DFFE ...
     """
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
+    text_template = FG_TEXT_TEMPLATE
 
-    scale_order = [
-        "primary",
-        "analogous-cool",
-        "analogous-warm",
-        "complement",
-        "split-complement-cool",
-        "split-complement-warm",
-        "neutral",
-    ]
+    for name, scale in palette.visible_scales():
+        hex_parts = scale.get_hex_list(gamut)
+        if use_color:
+            rgbs = [rgb for rgb in scale.get_rgb255_list(gamut) if rgb]
+            hex_parts = [
+                text_template % (*rgb, hex_val) for rgb, hex_val in zip(rgbs, hex_parts)
+            ]
 
-    for name in scale_order:
-        if name not in palette.scales:
-            continue
-        scale = palette.scales[name]
+        if buf.tell():
+            w("\n")
+        w(f"{name}: {' '.join(hex_parts)}")
 
-        hex_parts = []
-        for level in LEVELS:
-            color = scale.colors.get(level)
-            if color:
-                hex_val = color.hex_p3 if gamut == "p3" else color.hex_srgb
-                if use_color:
-                    if gamut == "p3":
-                        r, g, b = rgb01_to_255(color.p3_r, color.p3_g, color.p3_b)
-                    else:
-                        r, g, b = rgb01_to_255(color.srgb_r, color.srgb_g, color.srgb_b)
-                    hex_parts.append(f"{rgb_fg(r, g, b)}{hex_val}{RESET}")
-                else:
-                    hex_parts.append(hex_val)
+    return buf.getvalue()
 
-        lines.append(f"{name}: {' '.join(hex_parts)}")
 
-    return "\n".join(lines)
+def _shade_char(L: float) -> str:
+    """Choose block character based on lightness."""
+    if L > 0.8:
+        return LIGHT_SHADE
+    if L > 0.5:
+        return MEDIUM_SHADE
+    if L > 0.3:
+        return DARK_SHADE
+    return FULL_BLOCK
 
 
 def format_gradient(
@@ -1890,60 +2065,64 @@ def format_gradient(
         primary (264deg):
         ░░░▒▒▒▓▓▓███████████████████████████████████▓▓▓▒▒▒░░░
     """
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
-    scale_order = [
-        "primary",
-        "analogous-cool",
-        "analogous-warm",
-        "complement",
-        "split-complement-cool",
-        "split-complement-warm",
-        "neutral",
-    ]
-
-    for name in scale_order:
-        if name not in palette.scales:
-            continue
-        scale = palette.scales[name]
+    # Map each column to its level index once; every scale shares the mapping.
+    # Columns for a level are contiguous, so keep them as (index, run) pairs.
+    last = len(LEVELS) - 1
+    level_indices = [min(int(i / (width - 1) * last), last) for i in range(width)]
+    level_runs = [(idx, len(list(run))) for idx, run in groupby(level_indices)]
 
-        lines.append(f"{name} ({scale.oklch_hue:.0f}deg):")
+    # Globals used per level, bound once as locals
+    shade_char = _shade_char
+    text_template = FG_TEXT_TEMPLATE
 
-        # Build gradient
-        gradient_chars = []
-        for i in range(width):
-            # Map position to level
-            t = i / (width - 1)
-            level_idx = int(t * (len(LEVELS) - 1))
-            level = LEVELS[min(level_idx, len(LEVELS) - 1)]
+    for name, scale in palette.visible_scales():
+        w(f"{name} ({scale.oklch_hue:.0f}deg):\n")
 
-            color = scale.colors.get(level)
+        # Render each level's cell once, then repeat it across its columns
+        cells: List[str] = []
+        for color, rgb in zip(scale.colors, scale.get_rgb255_list(gamut)):
             if color:
-                if gamut == "p3":
-                    r, g, b = rgb01_to_255(color.p3_r, color.p3_g, color.p3_b)
-                else:
-                    r, g, b = rgb01_to_255(color.srgb_r, color.srgb_g, color.srgb_b)
-
-                # Choose block character based on lightness
-                L = color.oklch_l
-                if L > 0.8:
-                    char = LIGHT_SHADE
-                elif L > 0.5:
-                    char = MEDIUM_SHADE
-                elif L > 0.3:
-                    char = DARK_SHADE
-                else:
-                    char = FULL_BLOCK
+                char = shade_char(color.oklch_l)
+                cells.append(text_template % (*rgb, char) if use_color else char)
+            else:
+                cells.append("")
 
-                if use_color:
-                    gradient_chars.append(f"{rgb_fg(r, g, b)}{char}{RESET}")
-                else:
-                    gradient_chars.append(char)
+        # Runs go straight into the shared buffer; no per-scale line string
+        for idx, run in level_runs:
+            w(cells[idx] * run)
+        w("\n\n")
+
+    return buf.getvalue().rstrip()
+
+
+def format_output(palette: Palette, format: OutputFormat, gamut: Gamut = "p3") -> str:
+    """
+    Render the --format section(s) of the output.
+
+    Empty for 'none'; 'all' separates sections with a blank line.
+    """
+    out: List[str] = []
+    end = "\n\n" if format == "all" else "\n"
+
+    if format in ("palette", "all"):
+        out.append(format_palette_block(palette, gamut) + end)
+
+    if format in ("tailwind", "all"):
+        out.append(format_tailwind_config(palette) + end)
+
+    if format in ("json", "all"):
+        out.append(format_json(palette) + end)
 
-        lines.append("".join(gradient_chars))
-        lines.append("")
+    if format == "css":
+        out.append(format_css(palette, use_oklch=True) + end)
+
+    if format == "css-hex":
+        out.append(format_css(palette, use_oklch=False) + end)
 
-    return "\n".join(lines).rstrip()
+    return "".join(out)
 
 
 def output_palette(
@@ -1956,52 +2135,29 @@ def output_palette(
     use_color: bool = True,
 ) -> None:
     """Output palette in requested format(s) with optional visualization."""
+    # Collect everything and write it to stdout in one call
+    out: List[str] = []
 
     # Visualization output (before format output)
     if blocks:
-        print(format_blocks(palette, gamut, use_color))
-        print()
+        out.append(format_blocks(palette, gamut, use_color) + "\n\n")
 
     if colored_text:
-        print(format_colored_text(palette, gamut, use_color))
-        print()
+        out.append(format_colored_text(palette, gamut, use_color) + "\n\n")
 
     if gradient:
-        print(format_gradient(palette, gamut, use_color))
-        print()
-
-    # Skip format output if 'none'
-    if format == "none":
-        return
+        out.append(format_gradient(palette, gamut, use_color) + "\n\n")
 
-    # Format output (existing logic)
+    out.append(format_output(palette, format, gamut))
 
-    if format in ("palette", "all"):
-        print(format_palette_block(palette, gamut))
-        if format == "all":
-            print()
-
-    if format in ("tailwind", "all"):
-        print(format_tailwind_config(palette))
-        if format == "all":
-            print()
-
-    if format in ("json", "all"):
-        print(format_json(palette))
-        if format == "all":
-            print()
-
-    if format == "css":
-        print(format_css(palette, use_oklch=True))
-
-    if format == "css-hex":
-        print(format_css(palette, use_oklch=False))
+    sys.stdout.write("".join(out))
 
 
 # ========== CLI ==========
 
 
-def main() -> None:
+def build_parser() -> argparse.ArgumentParser:
+    """Build the palette.py argument parser."""
     description = """\
 PALETTE GENERATOR - OKLCH tonal scales with APCA contrast
 
@@ -2155,7 +2311,12 @@ HUE NAMES:
         help="Suppress progress messages",
     )
 
-    args = p.parse_args()
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the CLI on argv (defaults to sys.argv[1:]) and return the exit code."""
+    args = build_parser().parse_args(argv)
 
     # Parse hue arguments
     if not (1 <= len(args.hue) <= 3):
@@ -2181,23 +2342,12 @@ HUE NAMES:
 
     if args.chroma_mode == "both":
         # Generate both even and max
-        palette_even = generate_palette(
-            hue_weights=hue_weights,
-            chroma_mode="even",
-            gamut=args.gamut,
-            palette_set=args.set,
-            x_deg=args.x,
-            include_complementary=args.include_complementary,
-            neutral_max_chroma=args.neutral_chroma,
-        )
-        palette_max = generate_palette(
+        palette_even, palette_max = generate_even_and_max_palettes(
             hue_weights=hue_weights,
-            chroma_mode="max",
             gamut=args.gamut,
             palette_set=args.set,
             x_deg=args.x,
             include_complementary=args.include_complementary,
-            neutral_max_chroma=args.neutral_chroma,
         )
 
         # Auto-adjust if requested
@@ -2287,6 +2437,8 @@ HUE NAMES:
     if not args.quiet:
         print("Done.", file=sys.stderr)
 
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -15,18 +15,20 @@ Usage:
 
 import json
 import sys
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
+
+
+# V bars for analyze_v_patterns, indexed by int(v * 30) for V in [0, 1]
+_BARS = tuple("█" * i for i in range(31))
 
 
 def hex_to_rgb(hex_str: str) -> Tuple[int, int, int]:
     """Convert hex string (no #) to RGB 0-255."""
-    hex_str = hex_str.lstrip("#")
-    return (
-        int(hex_str[0:2], 16),
-        int(hex_str[2:4], 16),
-        int(hex_str[4:6], 16),
-    )
+    r, g, b = bytes.fromhex(hex_str.lstrip("#")[:6])
+    return r, g, b
 
 
 def rgb_to_hsv(r: int, g: int, b: int) -> Tuple[float, float, float]:
@@ -64,10 +66,24 @@ def hex_to_hsv(hex_str: str) -> Tuple[float, float, float]:
     return rgb_to_hsv(r, g, b)
 
 
-def process_json_data(data: List[dict]) -> Dict[int, Dict]:
+def hexes_to_hsv(hex_strs: List[str]) -> List[Tuple[float, float, float]]:
+    """Convert many 6-digit hex strings to HSV, decoding them all at once."""
+    # Trim like hex_to_rgb, and check each entry so a short one can't shift
+    # every following color onto the wrong bytes of the joined buffer
+    digits = [hex_str.lstrip("#")[:6] for hex_str in hex_strs]
+    bad = [hex_str for hex_str, d in zip(hex_strs, digits) if len(d) != 6]
+    if bad:
+        raise ValueError(f"Expected 6-digit hex colors, got: {', '.join(bad)}")
+    raw = bytes.fromhex("".join(digits))
+    return [rgb_to_hsv(raw[i], raw[i + 1], raw[i + 2]) for i in range(0, len(raw), 3)]
+
+
+def process_json_data(data: Iterable[dict]) -> Dict[int, Dict]:
     """
     Process the JSON data to extract all RYB hue positions.
 
+    ``data`` is only iterated once, so rounds may come from a generator.
+
     Returns dict mapping RYB hue to:
     {
         "hsv_hue": float,  # HSV hue of the BASE shade
@@ -79,57 +95,83 @@ def process_json_data(data: List[dict]) -> Dict[int, Dict]:
     """
     results = {}
 
-    for round_data in data:
-        colors = round_data["colors"]
+    # Gather every position's shades first so all hex values are decoded
+    # and converted to HSV in a single pass
+    entries = [
+        round_data["colors"][position]
+        for round_data in data
+        for position in ["primary", "secondary_a", "secondary_b", "complement"]
+    ]
+    all_hsv = hexes_to_hsv(
+        [shade for color_data in entries for shade in color_data["shades"]]
+    )
 
-        for position in ["primary", "secondary_a", "secondary_b", "complement"]:
-            color_data = colors[position]
-            ryb_hue = color_data["ryb_hue"]
-            shades = color_data["shades"]
+    start = 0
+    for color_data in entries:
+        ryb_hue = color_data["ryb_hue"]
+        shades = color_data["shades"]
 
-            # Convert all 5 shades to HSV
-            shade_hsv = [hex_to_hsv(shade) for shade in shades]
+        # All 5 shades as HSV
+        shade_hsv = all_hsv[start : start + len(shades)]
+        start += len(shades)
 
-            # Base shade is index 2 (most saturated)
-            base_hsv = shade_hsv[2]
+        # Base shade is index 2 (most saturated)
+        base_hsv = shade_hsv[2]
 
-            results[ryb_hue] = {
-                "hsv_hue": base_hsv[0],
-                "hsv_sat": base_hsv[1],
-                "hsv_val": base_hsv[2],
-                "shades": shade_hsv,
-                "hex_base": shades[2],
-            }
+        results[ryb_hue] = {
+            "hsv_hue": base_hsv[0],
+            "hsv_sat": base_hsv[1],
+            "hsv_val": base_hsv[2],
+            "shades": shade_hsv,
+            "hex_base": shades[2],
+        }
 
     return results
 
 
-def analyze_v_patterns(results: Dict[int, Dict]) -> None:
+@dataclass(frozen=True, slots=True)
+class HueColumns:
+    """Base-shade values as parallel lists, sorted by RYB hue."""
+
+    ryb_hue: List[int]
+    hsv_hue: List[float]
+    hsv_val: List[float]
+
+
+def hue_columns(results: Dict[int, Dict]) -> HueColumns:
+    """Split the per-hue results into columns once for the table passes."""
+    ryb_hues = sorted(results)
+    rows = [results[ryb_hue] for ryb_hue in ryb_hues]
+    return HueColumns(
+        ryb_hue=ryb_hues,
+        hsv_hue=[data["hsv_hue"] for data in rows],
+        hsv_val=[data["hsv_val"] for data in rows],
+    )
+
+
+def analyze_v_patterns(columns: HueColumns) -> None:
     """Analyze V patterns to understand brightness variations."""
     print("\n" + "=" * 60)
     print("V (Value/Brightness) ANALYSIS")
     print("=" * 60)
 
     # Group by V value to see patterns
-    v_by_hue = []
-    for ryb_hue in sorted(results.keys()):
-        data = results[ryb_hue]
-        hsv_hue = data["hsv_hue"]
-        v = data["hsv_val"]
-        v_by_hue.append((ryb_hue, hsv_hue, v))
+    v_by_hue = list(zip(columns.ryb_hue, columns.hsv_hue, columns.hsv_val))
 
     print("\nRYB Hue → HSV Hue → V (brightness):")
     print("-" * 50)
 
-    # Find min and max V
-    min_v = min(x[2] for x in v_by_hue)
-    max_v = max(x[2] for x in v_by_hue)
-    min_v_entry = [x for x in v_by_hue if x[2] == min_v][0]
+    # Find min and max V (min() keeps the first minimal entry, as before)
+    min_v_entry = min(v_by_hue, key=itemgetter(2))
+    min_v = min_v_entry[2]
+    max_v = max(columns.hsv_val)
 
-    for ryb_hue, hsv_hue, v in v_by_hue:
-        bar = "█" * int(v * 30)
-        marker = " ← MIN" if v == min_v else ""
-        print(f"RYB {ryb_hue:3d}° → HSV {hsv_hue:6.1f}° : V={v:.3f} {bar}{marker}")
+    rows = [
+        f"RYB {ryb_hue:3d}° → HSV {hsv_hue:6.1f}° : V={v:.3f} {_BARS[int(v * 30)]}"
+        f"{' ← MIN' if v == min_v else ''}"
+        for ryb_hue, hsv_hue, v in v_by_hue
+    ]
+    print("\n".join(rows))
 
     print(f"\nV range: {min_v:.3f} to {max_v:.3f}")
     print(f"Minimum V at: RYB {min_v_entry[0]}° (HSV {min_v_entry[1]:.1f}°)")
@@ -188,7 +230,7 @@ def analyze_shade_patterns(results: Dict[int, Dict]) -> None:
             )
 
 
-def generate_anchor_code(results: Dict[int, Dict]) -> str:
+def generate_anchor_code(columns: HueColumns) -> str:
     """Generate Python code for the new _RYB_HSV_ANCHORS."""
     lines = [
         "# RYB -> HSV anchors derived from Paletton.com data",
@@ -197,8 +239,7 @@ def generate_anchor_code(results: Dict[int, Dict]) -> str:
         "_RYB_HSV_ANCHORS: List[Tuple[float, float]] = [",
     ]
 
-    for ryb_hue in sorted(results.keys()):
-        hsv_hue = results[ryb_hue]["hsv_hue"]
+    for ryb_hue, hsv_hue in zip(columns.ryb_hue, columns.hsv_hue):
         lines.append(f"    ({ryb_hue:.1f}, {hsv_hue:.1f}),  # RYB {ryb_hue}°")
 
     # Add wrap-around point
@@ -208,15 +249,10 @@ def generate_anchor_code(results: Dict[int, Dict]) -> str:
     return "\n".join(lines)
 
 
-def generate_v_model_code(results: Dict[int, Dict]) -> str:
+def generate_v_model_code(columns: HueColumns) -> str:
     """Generate Python code for the V model based on observed patterns."""
     # Build V lookup table
-    v_data = []
-    for ryb_hue in sorted(results.keys()):
-        data = results[ryb_hue]
-        hsv_hue = data["hsv_hue"]
-        v = data["hsv_val"]
-        v_data.append((ryb_hue, hsv_hue, v))
+    v_data = zip(columns.ryb_hue, columns.hsv_hue, columns.hsv_val)
 
     lines = [
         "# V (brightness) values from Paletton at each RYB hue",
@@ -252,15 +288,14 @@ def main():
     # Process data
     results = process_json_data(data)
     print(f"Extracted {len(results)} unique RYB hue positions")
+    columns = hue_columns(results)
 
     # Build RYB → HSV mapping table
     print("\n" + "=" * 60)
     print("RYB → HSV HUE MAPPING (base shades only)")
     print("=" * 60)
 
-    for ryb_hue in sorted(results.keys()):
-        data = results[ryb_hue]
-        hsv_hue = data["hsv_hue"]
+    for ryb_hue, hsv_hue in zip(columns.ryb_hue, columns.hsv_hue):
         # Show the delta for interesting points
         diff = hsv_hue - ryb_hue
         if abs(diff) > 180:
@@ -268,7 +303,7 @@ def main():
         print(f"RYB {ryb_hue:3d}° → HSV {hsv_hue:6.1f}° (Δ = {diff:+6.1f}°)")
 
     # Analyze patterns
-    analyze_v_patterns(results)
+    analyze_v_patterns(columns)
     analyze_s_patterns(results)
     analyze_shade_patterns(results)
 
@@ -278,10 +313,10 @@ def main():
     print("=" * 60)
 
     print("\n# --- Anchor Table ---")
-    print(generate_anchor_code(results))
+    print(generate_anchor_code(columns))
 
     print("\n# --- V Model Table ---")
-    print(generate_v_model_code(results))
+    print(generate_v_model_code(columns))
 
     # Write mapping to file for reference
     output_path = Path(__file__).parent.parent / "assets" / "ryb_hsv_mapping.json"
@@ -3,26 +3,35 @@
 import pytest
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add scripts directory to path (sibling to tests/)
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
+# The fixtures below only hand out constant data and helpers that tests read
+# but never mutate, so they are built once per session
+
 # ANSI escape code pattern
 ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
-@pytest.fixture
-def strip_ansi():
-    """Fixture to strip ANSI escape codes from text."""
+# Shared across tests so repeated outputs are only scanned once
+@lru_cache(maxsize=4096)
+def _strip(text: str) -> str:
+    # Most captured output is plain text; skip the regex when there is no ESC
+    if "\x1b" not in text:
+        return text
+    return ANSI_ESCAPE.sub("", text)
 
-    def _strip(text: str) -> str:
-        return ANSI_ESCAPE.sub("", text)
 
+@pytest.fixture(scope="session")
+def strip_ansi():
+    """Fixture to strip ANSI escape codes from text."""
     return _strip
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def color_tolerance():
     """Tolerance values for color comparisons."""
     return {
@@ -34,7 +43,7 @@ def color_tolerance():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def reference_colors():
     """Reference colors for testing conversions."""
     return {
@@ -68,7 +77,7 @@ def reference_colors():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def apca_reference_pairs():
     """Reference text/bg pairs with known APCA Lc values."""
     return [
@@ -80,7 +89,20 @@ def apca_reference_pairs():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scripts_dir():
     """Path to the scripts directory."""
     return Path(__file__).parent.parent / "scripts"
+
+
+@pytest.fixture(scope="session")
+def sample_palette():
+    """Base sRGB palette for a pure Blue brand, shared by the formatter tests."""
+    from palette import generate_palette
+
+    return generate_palette(
+        hue_weights=[("Blue", 1.0)],
+        chroma_mode="even",
+        gamut="srgb",
+        palette_set="base",
+    )
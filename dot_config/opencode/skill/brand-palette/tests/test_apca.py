@@ -2,34 +2,34 @@
 
 import pytest
 
+from color_utils import (
+    apca_func_for_gamut,
+    auto_adjust_for_contrast,
+    calc_apca,
+    calc_apca_batch,
+    calc_apca_for_gamut,
+    calc_apca_from_rgb01,
+    calc_apca_p3,
+    p3_to_y_apca,
+    _APCA_P3_BCO,
+    _APCA_P3_GCO,
+    _APCA_P3_RCO,
+    _APCA_S_BCO,
+    _APCA_S_GCO,
+    _APCA_S_RCO,
+)
+
 
 class TestAPCACalculation:
     """Tests for APCA contrast calculation."""
 
-    def test_black_on_white(self, apca_reference_pairs):
-        from color_utils import calc_apca
-
-        text, bg, expected, tolerance = apca_reference_pairs[0]
-        lc = calc_apca(text, bg)
-        assert abs(lc - expected) < tolerance
-
-    def test_white_on_black(self, apca_reference_pairs):
-        from color_utils import calc_apca
-
-        text, bg, expected, tolerance = apca_reference_pairs[1]
-        lc = calc_apca(text, bg)
-        assert abs(lc - expected) < tolerance
-
-    def test_gray_on_white(self, apca_reference_pairs):
-        from color_utils import calc_apca
-
-        text, bg, expected, tolerance = apca_reference_pairs[2]
+    @pytest.mark.parametrize("idx", [0, 1, 2])
+    def test_reference_pair(self, apca_reference_pairs, idx):
+        text, bg, expected, tolerance = apca_reference_pairs[idx]
         lc = calc_apca(text, bg)
         assert abs(lc - expected) < tolerance
 
     def test_polarity_matters(self):
-        from color_utils import calc_apca
-
         # Black on white vs white on black should have opposite signs
         lc1 = calc_apca((0, 0, 0), (255, 255, 255))
         lc2 = calc_apca((255, 255, 255), (0, 0, 0))
@@ -37,8 +37,6 @@ class TestAPCACalculation:
         assert lc2 < 0  # Light text on dark bg is negative
 
     def test_same_color_zero_contrast(self):
-        from color_utils import calc_apca
-
         lc = calc_apca((128, 128, 128), (128, 128, 128))
         assert abs(lc) < 1.0  # Near zero contrast
 
@@ -47,8 +45,6 @@ class TestAPCAFromRGB01:
     """Tests for RGB 0-1 wrapper."""
 
     def test_conversion_matches(self):
-        from color_utils import calc_apca, calc_apca_from_rgb01
-
         lc1 = calc_apca((0, 0, 0), (255, 255, 255))
         lc2 = calc_apca_from_rgb01((0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
         assert abs(lc1 - lc2) < 0.1
@@ -58,8 +54,6 @@ class TestAutoAdjustForContrast:
     """Tests for APCA auto-adjustment function."""
 
     def test_lighter_adjustment(self):
-        from color_utils import auto_adjust_for_contrast
-
         # A color that needs to be lighter to achieve 60 Lc vs dark bg
         L_new, C_new, H, lc, success = auto_adjust_for_contrast(
             L=0.5,
@@ -76,8 +70,6 @@ class TestAutoAdjustForContrast:
         assert lc >= 60.0  # Should meet threshold
 
     def test_darker_adjustment(self):
-        from color_utils import auto_adjust_for_contrast
-
         # A color that needs to be darker to achieve 60 Lc vs light bg
         L_new, C_new, H, lc, success = auto_adjust_for_contrast(
             L=0.5,
@@ -94,8 +86,6 @@ class TestAutoAdjustForContrast:
         assert lc >= 60.0  # Should meet threshold
 
     def test_hue_preserved(self):
-        from color_utils import auto_adjust_for_contrast
-
         original_H = 145.0
         L_new, C_new, H, lc, success = auto_adjust_for_contrast(
             L=0.7,
@@ -111,8 +101,6 @@ class TestAutoAdjustForContrast:
         assert H == original_H
 
     def test_max_delta_l_respected(self):
-        from color_utils import auto_adjust_for_contrast
-
         max_delta = 0.1
         original_L = 0.5
         L_new, C_new, H, lc, success = auto_adjust_for_contrast(
@@ -133,11 +121,7 @@ class TestP3APCA:
     """Tests for Display P3 APCA calculations."""
 
     def test_p3_coefficients_exist(self):
-        from color_utils import _APCA_P3_RCO, _APCA_P3_GCO, _APCA_P3_BCO
-
         # P3 coefficients should be different from sRGB
-        from color_utils import _APCA_S_RCO, _APCA_S_GCO, _APCA_S_BCO
-
         assert _APCA_P3_RCO != _APCA_S_RCO
         assert _APCA_P3_GCO != _APCA_S_GCO
         assert _APCA_P3_BCO != _APCA_S_BCO
@@ -148,8 +132,6 @@ class TestP3APCA:
         assert abs(_APCA_P3_BCO - 0.0792677779341829) < 1e-10
 
     def test_p3_to_y_apca(self):
-        from color_utils import p3_to_y_apca
-
         # White should have Y close to 1
         y_white = p3_to_y_apca(1.0, 1.0, 1.0)
         assert abs(y_white - 1.0) < 0.01
@@ -159,22 +141,16 @@ class TestP3APCA:
         assert y_black < 0.001
 
     def test_calc_apca_p3_black_on_white(self):
-        from color_utils import calc_apca_p3
-
         # Black on white should give high positive contrast
         lc = calc_apca_p3((0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
         assert lc > 100  # Should be around 106
 
     def test_calc_apca_p3_white_on_black(self):
-        from color_utils import calc_apca_p3
-
         # White on black should give high negative contrast
         lc = calc_apca_p3((1.0, 1.0, 1.0), (0.0, 0.0, 0.0))
         assert lc < -100  # Should be around -108
 
     def test_p3_apca_differs_from_srgb_for_same_values(self):
-        from color_utils import calc_apca_p3, calc_apca_from_rgb01
-
         # For the same numerical RGB values, P3 and sRGB APCA should differ
         # because they use different luminance coefficients
         text = (0.5, 0.3, 0.2)
@@ -189,8 +165,6 @@ class TestP3APCA:
         assert abs(lc_p3 - lc_srgb) < 5
 
     def test_calc_apca_for_gamut_selects_correct_function(self):
-        from color_utils import calc_apca_for_gamut, calc_apca_p3, calc_apca_from_rgb01
-
         text = (0.2, 0.4, 0.8)
         bg = (0.95, 0.95, 0.95)
 
@@ -204,9 +178,19 @@ class TestP3APCA:
         lc_srgb_direct = calc_apca_from_rgb01(text, bg)
         assert lc_srgb_via_gamut == lc_srgb_direct
 
-    def test_auto_adjust_uses_p3_in_p3_mode(self):
-        from color_utils import auto_adjust_for_contrast
+    def test_apca_func_for_gamut(self):
+        assert apca_func_for_gamut("p3") is calc_apca_p3
+        assert apca_func_for_gamut("srgb") is calc_apca_from_rgb01
 
+    def test_calc_apca_batch_matches_per_color(self):
+        texts = [(0.2, 0.4, 0.8), (0.0, 0.0, 0.0), (0.9, 0.85, 0.1)]
+        bg = (0.95, 0.95, 0.95)
+
+        for gamut in ("srgb", "p3"):
+            expected = [calc_apca_for_gamut(t, bg, gamut) for t in texts]
+            assert calc_apca_batch(texts, bg, gamut) == expected
+
+    def test_auto_adjust_uses_p3_in_p3_mode(self):
         # Test that auto-adjust works in P3 mode
         L_new, C_new, H, lc, success = auto_adjust_for_contrast(
             L=0.5,
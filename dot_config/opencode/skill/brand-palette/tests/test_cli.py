@@ -1,113 +1,115 @@
 """Tests for CLI argument parsing."""
 
+import io
 import pytest
 import subprocess
 import sys
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from types import SimpleNamespace
+
+from palette import build_parser, format_output, main
 
 
 # Get the scripts directory path
 SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
 PALETTE_SCRIPT = SCRIPTS_DIR / "palette.py"
 
+# Argument groups and flags (new flags from all phases) --help must list
+HELP_SECTIONS = (
+    "REQUIRED",
+    "OUTPUT FORMAT",
+    "VISUALIZATION",
+    "COLOR OPTIONS",
+    "ACCESSIBILITY",
+    "EXAMPLES",
+)
+HELP_FLAGS = (
+    "--auto-adjust",
+    "--blocks",
+    "--colored-text",
+    "--gradient",
+    "--format",
+    "css",
+)
+
+# Silence progress messages and skip the APCA report
+QUIET_ARGS = ("--quiet", "--no-validate-apca")
+
+
+def run_cli(*args: str) -> SimpleNamespace:
+    """Run palette.main in-process, shaped like a subprocess.run result."""
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            returncode = main(list(args))
+        except SystemExit as e:
+            # Mirror the interpreter: a message exits 1 after printing it
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+                returncode = 1
+            else:
+                returncode = e.code or 0
+    return SimpleNamespace(
+        returncode=returncode, stdout=out.getvalue(), stderr=err.getvalue()
+    )
+
+
+def run_quiet(*args: str) -> SimpleNamespace:
+    """run_cli with the flags every generation test passes appended."""
+    return run_cli(*args, *QUIET_ARGS)
+
 
 class TestHelpOutput:
     """Tests for --help output."""
 
-    def test_help_exits_zero(self):
+    def test_script_help_exits_zero(self):
+        """Smoke test the script entry point in a real interpreter."""
+        # Only ASCII markers are checked, so the output is left undecoded.
+        # -E -s skip PYTHON* variables and the user site; -I would also drop
+        # the script directory from sys.path and break the color_utils import.
         result = subprocess.run(
-            [sys.executable, str(PALETTE_SCRIPT), "--help"],
+            [sys.executable, "-E", "-s", str(PALETTE_SCRIPT), "--help"],
             capture_output=True,
-            text=True,
         )
         assert result.returncode == 0
+        assert b"EXAMPLES" in result.stdout
+
+    def test_help_exits_zero(self):
+        result = run_cli("--help")
+        assert result.returncode == 0
 
     def test_help_contains_sections(self):
-        result = subprocess.run(
-            [sys.executable, str(PALETTE_SCRIPT), "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert "REQUIRED" in result.stdout
-        assert "OUTPUT FORMAT" in result.stdout
-        assert "VISUALIZATION" in result.stdout
-        assert "COLOR OPTIONS" in result.stdout
-        assert "ACCESSIBILITY" in result.stdout
-        assert "EXAMPLES" in result.stdout
+        help_text = build_parser().format_help()
+        missing = [section for section in HELP_SECTIONS if section not in help_text]
+        assert not missing
 
     def test_help_contains_new_flags(self):
-        result = subprocess.run(
-            [sys.executable, str(PALETTE_SCRIPT), "--help"],
-            capture_output=True,
-            text=True,
-        )
-        # New flags from all phases
-        assert "--auto-adjust" in result.stdout
-        assert "--blocks" in result.stdout
-        assert "--colored-text" in result.stdout
-        assert "--gradient" in result.stdout
-        assert "--format" in result.stdout
-        assert "css" in result.stdout
+        help_text = build_parser().format_help()
+        missing = [flag for flag in HELP_FLAGS if flag not in help_text]
+        assert not missing
 
 
 class TestHueArgParsing:
     """Tests for --hue argument parsing."""
 
     def test_valid_single_hue(self):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--format",
-                "json",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
-        )
+        result = run_quiet("--hue", "Blue:1", "--format", "json")
         assert result.returncode == 0
 
     def test_valid_multi_hue(self):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:0.6",
-                "--hue",
-                "Purple:0.4",
-                "--format",
-                "json",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
+        result = run_quiet(
+            "--hue", "Blue:0.6", "--hue", "Purple:0.4", "--format", "json"
         )
         assert result.returncode == 0
 
     def test_invalid_hue_name(self):
-        result = subprocess.run(
-            [sys.executable, str(PALETTE_SCRIPT), "--hue", "NotAColor:1"],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
-        )
+        result = run_cli("--hue", "NotAColor:1")
         assert result.returncode != 0
         assert "Unknown hue" in result.stderr or "error" in result.stderr.lower()
 
     def test_missing_weight(self):
-        result = subprocess.run(
-            [sys.executable, str(PALETTE_SCRIPT), "--hue", "Blue"],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
-        )
+        result = run_cli("--hue", "Blue")
         assert result.returncode != 0
 
 
@@ -115,80 +117,25 @@ class TestFormatOptions:
     """Tests for --format options."""
 
     @pytest.mark.parametrize("fmt", ["palette", "tailwind", "json", "css", "css-hex"])
-    def test_format_produces_output(self, fmt):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--format",
-                fmt,
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
-        )
-        assert result.returncode == 0
-        assert len(result.stdout) > 0
+    def test_format_produces_output(self, sample_palette, fmt):
+        # The palette is shared; only the rendering differs per format
+        assert len(format_output(sample_palette, fmt, "srgb")) > 0
 
     def test_format_none_produces_no_output(self):
         """Test that --format none produces no stdout output."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--format",
-                "none",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
-        )
+        result = run_quiet("--hue", "Blue:1", "--format", "none")
         assert result.returncode == 0
         assert result.stdout.strip() == ""
 
     def test_default_format_is_none(self):
         """Test that default format (no --format flag) produces no output."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
-        )
+        result = run_quiet("--hue", "Blue:1")
         assert result.returncode == 0
         assert result.stdout.strip() == ""
 
     def test_blocks_alone_no_format_output(self):
         """Test that --blocks without --format shows only visualization."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--blocks",
-                "--no-color",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
-        )
+        result = run_quiet("--hue", "Blue:1", "--blocks", "--no-color")
         assert result.returncode == 0
         # Should have block visualization
         assert "primary" in result.stdout
@@ -199,22 +146,8 @@ class TestFormatOptions:
 
     def test_explicit_format_with_viz_works(self):
         """Test that --blocks with explicit --format shows both."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--blocks",
-                "--format",
-                "json",
-                "--no-color",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
+        result = run_quiet(
+            "--hue", "Blue:1", "--blocks", "--format", "json", "--no-color"
         )
         assert result.returncode == 0
         # Should have block visualization
@@ -228,23 +161,7 @@ class TestGamutOptions:
 
     @pytest.mark.parametrize("gamut", ["p3", "srgb"])
     def test_gamut_accepted(self, gamut):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--gamut",
-                gamut,
-                "--format",
-                "json",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
-        )
+        result = run_quiet("--hue", "Blue:1", "--gamut", gamut, "--format", "json")
         assert result.returncode == 0
 
 
@@ -252,42 +169,18 @@ class TestAutoAdjust:
     """Tests for --auto-adjust flag."""
 
     def test_auto_adjust_flag_accepted(self):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Yellow:1",
-                "--auto-adjust",
-                "--format",
-                "palette",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
-        )
+        result = run_quiet("--hue", "Yellow:1", "--auto-adjust", "--format", "palette")
         assert result.returncode == 0
 
     def test_auto_adjust_with_max_adjust(self):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Yellow:1",
-                "--auto-adjust",
-                "--max-adjust",
-                "0.1",
-                "--format",
-                "palette",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
+        result = run_quiet(
+            "--hue",
+            "Yellow:1",
+            "--auto-adjust",
+            "--max-adjust",
+            "0.1",
+            "--format",
+            "palette",
         )
         assert result.returncode == 0
 
@@ -296,85 +189,34 @@ class TestVisualizationFlags:
     """Tests for visualization flags."""
 
     def test_blocks_flag(self):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--blocks",
-                "--no-color",
-                "--format",
-                "palette",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
+        result = run_quiet(
+            "--hue", "Blue:1", "--blocks", "--no-color", "--format", "palette"
         )
         assert result.returncode == 0
         assert "primary" in result.stdout  # Block visualization includes scale names
 
     def test_colored_text_flag(self):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--colored-text",
-                "--no-color",
-                "--format",
-                "palette",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
+        result = run_quiet(
+            "--hue", "Blue:1", "--colored-text", "--no-color", "--format", "palette"
         )
         assert result.returncode == 0
         assert "#" in result.stdout  # Hex values
 
     def test_gradient_flag(self):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--gradient",
-                "--no-color",
-                "--format",
-                "palette",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
+        result = run_quiet(
+            "--hue", "Blue:1", "--gradient", "--no-color", "--format", "palette"
         )
         assert result.returncode == 0
         assert "deg" in result.stdout  # Gradient shows hue degrees
 
     def test_combined_visualization_flags(self):
-        result = subprocess.run(
-            [
-                sys.executable,
-                str(PALETTE_SCRIPT),
-                "--hue",
-                "Blue:1",
-                "--blocks",
-                "--colored-text",
-                "--no-color",
-                "--format",
-                "palette",
-                "--quiet",
-                "--no-validate-apca",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=str(SCRIPTS_DIR),
+        result = run_quiet(
+            "--hue",
+            "Blue:1",
+            "--blocks",
+            "--colored-text",
+            "--no-color",
+            "--format",
+            "palette",
         )
         assert result.returncode == 0
@@ -49,6 +49,29 @@ import os
 import re
 import sys
 from datetime import datetime, timezone
+from typing import Iterator
+
+# Filename slugs keep ASCII letters, digits and single hyphens
+SLUG_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9-]")
+DASH_RUN_RE = re.compile(r"-+")
+
+# Automated checks in report order, with the command each one runs
+CHECK_COMMANDS = {
+    "tests": "bun test",
+    "types": "bun run typecheck",
+    "lint": "bun run lint",
+}
+
+CHECK_RESULT_SYMBOLS = {
+    "pass": "✓ Pass",
+    "fail": "✗ Fail",
+}
+
+STEP_STATUS_SYMBOLS = {
+    "complete": "✓ Complete",
+    "partial": "⚠️ Partial",
+    "missing": "✗ Missing",
+}
 
 
 def render_verdict_section(data: dict) -> str:
@@ -133,24 +156,11 @@ def render_code_review(code_review: dict) -> str:
 def render_checks_table(checks: dict) -> str:
     """Render automated checks table."""
     rows = []
-
-    check_commands = {
-        "tests": "bun test",
-        "types": "bun run typecheck",
-        "lint": "bun run lint",
-    }
-
-    for name, cmd in check_commands.items():
+    for name, cmd in CHECK_COMMANDS.items():
         check = checks.get(name, {})
         result = check.get("result", "unknown")
         detail = check.get("detail", "")
-        result_symbol = (
-            "✓ Pass"
-            if result == "pass"
-            else "✗ Fail"
-            if result == "fail"
-            else "? Unknown"
-        )
+        result_symbol = CHECK_RESULT_SYMBOLS.get(result, "? Unknown")
         rows.append(f"| {name.title()} | `{cmd}` | {result_symbol} | {detail} |")
 
     return """| Check | Command | Result | Notes |
@@ -164,14 +174,8 @@ def render_steps_table(steps: list) -> str:
         return "No steps defined in plan."
 
     rows = []
-    status_symbols = {
-        "complete": "✓ Complete",
-        "partial": "⚠️ Partial",
-        "missing": "✗ Missing",
-    }
-
     for step in steps:
-        status = status_symbols.get(step.get("status", "unknown"), "? Unknown")
+        status = STEP_STATUS_SYMBOLS.get(step.get("status", "unknown"), "? Unknown")
         rows.append(
             f"| {step.get('id', '?')} | {step.get('description', 'No description')} | {status} |"
         )
@@ -251,11 +255,11 @@ def render_next_steps(data: dict) -> str:
 """
 
 
-def render_report(data: dict) -> str:
-    """Render the full validation report."""
+def iter_report(data: dict) -> Iterator[str]:
+    """Yield the full validation report section by section."""
     now = datetime.now(timezone.utc).isoformat()
 
-    header = f"""# Validation Report: {data.get("plan", "Unknown Plan")} - Phase {data.get("phase", "?")}
+    yield f"""# Validation Report: {data.get("plan", "Unknown Plan")} - Phase {data.get("phase", "?")}
 
 **Plan**: [[{data.get("plan", "unknown")}]]
 **Phase**: {data.get("phase", "?")} - {data.get("phase_title", "Unknown")}
@@ -266,29 +270,23 @@ def render_report(data: dict) -> str:
 ---
 
 """
-
-    verdict = render_verdict_section(data)
-    code_review = render_code_review(data.get("code_review", {}))
-    plan_validation = render_plan_validation(data.get("plan_validation", {}))
-    next_steps = render_next_steps(data)
-
-    footer = f"""
+    yield render_verdict_section(data)
+    yield "\n---\n\n"
+    yield render_code_review(data.get("code_review", {}))
+    yield "\n---\n\n"
+    yield render_plan_validation(data.get("plan_validation", {}))
+    yield "\n---\n\n"
+    yield render_next_steps(data)
+    yield f"""
 ---
 
 **Validation completed**: {now}
 """
 
-    return (
-        header
-        + verdict
-        + "\n---\n\n"
-        + code_review
-        + "\n---\n\n"
-        + plan_validation
-        + "\n---\n\n"
-        + next_steps
-        + footer
-    )
+
+def render_report(data: dict) -> str:
+    """Render the full validation report."""
+    return "".join(iter_report(data))
 
 
 def generate_filename(data: dict) -> str:
@@ -298,8 +296,8 @@ def generate_filename(data: dict) -> str:
 
     # Sanitize plan name for filename
     plan = data.get("plan", "unknown")
-    plan_slug = re.sub(r"[^a-zA-Z0-9-]", "-", plan.lower())
-    plan_slug = re.sub(r"-+", "-", plan_slug).strip("-")
+    plan_slug = SLUG_UNSAFE_RE.sub("-", plan.lower())
+    plan_slug = DASH_RUN_RE.sub("-", plan_slug).strip("-")
 
     phase = data.get("phase", "0")
 
@@ -337,22 +335,29 @@ def main():
         with open(input_file, "r") as f:
             data = json.load(f)
 
-    # Render report
-    report = render_report(data)
-
-    # Output
+    # Render report. Files are streamed section by section into a temp file
+    # that only replaces the real report once rendering has succeeded, so a
+    # failing renderer never leaves a truncated report behind
     if output_dir:
         os.makedirs(output_dir, exist_ok=True)
         filename = generate_filename(data)
         output_path = os.path.join(output_dir, filename)
 
-        with open(output_path, "w") as f:
-            f.write(report)
+        tmp_path = output_path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                f.writelines(iter_report(data))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        os.replace(tmp_path, output_path)
 
         # Print path to stderr so caller knows where it went
         print(f"Saved: {output_path}", file=sys.stderr)
     else:
-        print(report)
+        # Render fully before printing so errors never emit half a report
+        print(render_report(data))
 
 
 if __name__ == "__main__":
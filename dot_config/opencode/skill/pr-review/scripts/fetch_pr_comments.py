@@ -13,39 +13,17 @@ import json
 import subprocess
 import sys
 
+from fetch_review_threads import fetch_thread_nodes, simplify_comments
 
-def run_gh(args: list[str]) -> str:
-    """Run gh CLI command and return output."""
-    result = subprocess.run(
-        ["gh"] + args,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout.strip()
 
+def fetch_comments(owner: str, repo: str, pr_number: int) -> list[dict]:
+    """Fetch code review comments (inline comments on specific lines).
 
-def fetch_comments(owner: str, repo: str, pr_number: str) -> list[dict]:
-    """Fetch code review comments (inline comments on specific lines)."""
-    endpoint = f"repos/{owner}/{repo}/pulls/{pr_number}/comments"
-    output = run_gh(["api", endpoint])
-    comments = json.loads(output)
-
-    # Transform to simplified format
-    return [
-        {
-            "id": c["id"],
-            "path": c["path"],
-            "line": c.get("line"),
-            "original_line": c.get("original_line"),
-            "body": c["body"],
-            "author": c["user"]["login"],
-            "created_at": c["created_at"],
-            "in_reply_to_id": c.get("in_reply_to_id"),
-            "html_url": c["html_url"],
-        }
-        for c in comments
-    ]
+    Reuses the review-thread GraphQL query, paging each thread's comments in
+    full, instead of paging through the REST comments endpoint.
+    """
+    threads = fetch_thread_nodes(owner, repo, pr_number, all_comments=True)
+    return simplify_comments(threads)
 
 
 def main():
@@ -56,7 +34,7 @@ def main():
         )
         sys.exit(1)
 
-    owner, repo, pr_number = sys.argv[1:4]
+    owner, repo, pr_number = sys.argv[1], sys.argv[2], int(sys.argv[3])
 
     try:
         comments = fetch_comments(owner, repo, pr_number)
@@ -5,8 +5,12 @@
 """
 Fetch all review threads with resolution status using GraphQL.
 
-Usage: uv run fetch_review_threads.py <OWNER> <REPO> <PR_NUMBER>
+Usage: uv run fetch_review_threads.py <OWNER> <REPO> <PR_NUMBER> [--with-comments]
 Output: JSON with thread IDs, resolution status, and first comment
+
+With --with-comments the output is {"threads": [...], "comments": [...]}, where
+comments matches fetch_pr_comments.py; both come from the same GraphQL pages,
+so a full review pass needs one round-trip instead of two.
 """
 
 import json
@@ -14,26 +18,48 @@ import subprocess
 import sys
 
 
-GRAPHQL_QUERY = """
-query($owner: String!, $repo: String!, $pr: Int!) {
+COMMENT_FIELDS = """
+fragment CommentFields on PullRequestReviewComment {
+  id
+  databaseId
+  body
+  author {
+    login
+  }
+  createdAt
+  path
+  line
+  originalLine
+  replyTo {
+    databaseId
+  }
+  url
+}
+"""
+
+GRAPHQL_QUERY = (
+    """
+query($owner: String!, $repo: String!, $pr: Int!, $cursor: String, $commentCount: Int!) {
   repository(owner: $owner, name: $repo) {
     pullRequest(number: $pr) {
-      reviewThreads(first: 100) {
+      reviewThreads(first: 100, after: $cursor) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
         nodes {
           id
           isResolved
           isOutdated
           path
           line
-          comments(first: 1) {
+          comments(first: $commentCount) {
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
             nodes {
-              id
-              databaseId
-              body
-              author {
-                login
-              }
-              createdAt
+              ...CommentFields
             }
           }
         }
@@ -42,12 +68,41 @@ query($owner: String!, $repo: String!, $pr: Int!) {
   }
 }
 """
+    + COMMENT_FIELDS
+)
+
+# Follow-up pages for threads with more than 100 comments
+THREAD_COMMENTS_QUERY = (
+    """
+query($threadId: ID!, $cursor: String) {
+  node(id: $threadId) {
+    ... on PullRequestReviewThread {
+      comments(first: 100, after: $cursor) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          ...CommentFields
+        }
+      }
+    }
+  }
+}
+"""
+    + COMMENT_FIELDS
+)
+
+# Keys of the first comment as reported before the query carried full threads
+FIRST_COMMENT_KEYS = ("id", "databaseId", "body", "author", "createdAt")
 
 
 def run_gh_graphql(query: str, variables: dict) -> dict:
     """Run gh GraphQL query and return output."""
     args = ["api", "graphql", "-f", f"query={query}"]
     for key, value in variables.items():
+        if value is None:
+            continue
         if isinstance(value, int):
             args.extend(["-F", f"{key}={value}"])
         else:
@@ -62,14 +117,49 @@ def run_gh_graphql(query: str, variables: dict) -> dict:
     return json.loads(result.stdout)
 
 
-def fetch_threads(owner: str, repo: str, pr_number: int) -> list[dict]:
-    """Fetch review threads with resolution status."""
-    variables = {"owner": owner, "repo": repo, "pr": pr_number}
-    data = run_gh_graphql(GRAPHQL_QUERY, variables)
-
-    threads = data["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
-
-    # Transform to simplified format
+def fetch_thread_nodes(
+    owner: str, repo: str, pr_number: int, all_comments: bool = False
+) -> list[dict]:
+    """Fetch every review thread as raw GraphQL nodes.
+
+    Threads carry only their first comment unless `all_comments` is set, in
+    which case each thread's comments are paged in full.
+    """
+    variables = {
+        "owner": owner,
+        "repo": repo,
+        "pr": pr_number,
+        "cursor": None,
+        "commentCount": 100 if all_comments else 1,
+    }
+    nodes = []
+    while True:
+        data = run_gh_graphql(GRAPHQL_QUERY, variables)
+        page = data["data"]["repository"]["pullRequest"]["reviewThreads"]
+        nodes.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        variables["cursor"] = page["pageInfo"]["endCursor"]
+
+    if all_comments:
+        for thread in nodes:
+            comments = thread["comments"]
+            while comments["pageInfo"]["hasNextPage"]:
+                data = run_gh_graphql(
+                    THREAD_COMMENTS_QUERY,
+                    {
+                        "threadId": thread["id"],
+                        "cursor": comments["pageInfo"]["endCursor"],
+                    },
+                )
+                more = data["data"]["node"]["comments"]
+                comments["nodes"].extend(more["nodes"])
+                comments["pageInfo"] = more["pageInfo"]
+    return nodes
+
+
+def simplify_threads(threads: list[dict]) -> list[dict]:
+    """Transform thread nodes to the simplified thread format."""
     return [
         {
             "thread_id": t["id"],
@@ -77,7 +167,9 @@ def fetch_threads(owner: str, repo: str, pr_number: int) -> list[dict]:
             "is_outdated": t["isOutdated"],
             "path": t["path"],
             "line": t["line"],
-            "first_comment": t["comments"]["nodes"][0]
+            "first_comment": {
+                key: t["comments"]["nodes"][0][key] for key in FIRST_COMMENT_KEYS
+            }
             if t["comments"]["nodes"]
             else None,
         }
@@ -85,19 +177,61 @@ def fetch_threads(owner: str, repo: str, pr_number: int) -> list[dict]:
     ]
 
 
+def simplify_comments(threads: list[dict]) -> list[dict]:
+    """Flatten thread nodes into the simplified comment format, oldest first."""
+    comments = [c for t in threads for c in t["comments"]["nodes"]]
+    # REST listed comments oldest first; keep that order
+    comments.sort(key=lambda c: c["databaseId"])
+
+    return [
+        {
+            "id": c["databaseId"],
+            "path": c["path"],
+            "line": c.get("line"),
+            "original_line": c.get("originalLine"),
+            "body": c["body"],
+            "author": (c["author"] or {}).get("login"),
+            "created_at": c["createdAt"],
+            "in_reply_to_id": c["replyTo"]["databaseId"] if c["replyTo"] else None,
+            "html_url": c["url"],
+        }
+        for c in comments
+    ]
+
+
+def fetch_threads(owner: str, repo: str, pr_number: int) -> list[dict]:
+    """Fetch review threads with resolution status."""
+    return simplify_threads(fetch_thread_nodes(owner, repo, pr_number))
+
+
+def fetch_threads_and_comments(owner: str, repo: str, pr_number: int) -> dict:
+    """Fetch threads and all their comments from one set of GraphQL pages."""
+    threads = fetch_thread_nodes(owner, repo, pr_number, all_comments=True)
+    return {
+        "threads": simplify_threads(threads),
+        "comments": simplify_comments(threads),
+    }
+
+
 def main():
-    if len(sys.argv) != 4:
+    args = [arg for arg in sys.argv[1:] if arg != "--with-comments"]
+    with_comments = len(args) != len(sys.argv) - 1
+
+    if len(args) != 3:
         print(
-            "Usage: uv run fetch_review_threads.py <OWNER> <REPO> <PR_NUMBER>",
+            "Usage: uv run fetch_review_threads.py <OWNER> <REPO> <PR_NUMBER> [--with-comments]",
             file=sys.stderr,
         )
         sys.exit(1)
 
-    owner, repo, pr_number = sys.argv[1], sys.argv[2], int(sys.argv[3])
+    owner, repo, pr_number = args[0], args[1], int(args[2])
 
     try:
-        threads = fetch_threads(owner, repo, pr_number)
-        print(json.dumps(threads, indent=2))
+        if with_comments:
+            result = fetch_threads_and_comments(owner, repo, pr_number)
+        else:
+            result = fetch_threads(owner, repo, pr_number)
+        print(json.dumps(result, indent=2))
     except subprocess.CalledProcessError as e:
         print(f"Error: {e.stderr}", file=sys.stderr)
         sys.exit(1)
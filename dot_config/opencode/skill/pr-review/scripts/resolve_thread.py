@@ -3,10 +3,13 @@
 # dependencies = []
 # ///
 """
-Resolve a review thread by its GraphQL ID.
+Resolve one or more review threads by their GraphQL IDs.
 
-Usage: uv run resolve_thread.py <THREAD_ID>
-Output: JSON with resolution confirmation
+Usage: uv run resolve_thread.py <THREAD_ID> [THREAD_ID ...]
+Output: JSON with resolution confirmation (a list when given several IDs)
+
+Several IDs are resolved in a single mutation, so cleaning up a review costs
+one gh call rather than one per thread.
 """
 
 import json
@@ -14,16 +17,21 @@ import subprocess
 import sys
 
 
-MUTATION = """
-mutation($threadId: ID!) {
-  resolveReviewThread(input: {threadId: $threadId}) {
-    thread {
+# One aliased resolveReviewThread per thread ID
+RESOLVE_FIELD = """
+  r{index}: resolveReviewThread(input: {{threadId: $t{index}}}) {{
+    thread {{
       id
       isResolved
-    }
-  }
-}
-"""
+    }}
+  }}"""
+
+
+def build_mutation(count: int) -> str:
+    """Build a mutation resolving `count` threads passed as $t0, $t1, ..."""
+    params = ", ".join(f"$t{i}: ID!" for i in range(count))
+    fields = "".join(RESOLVE_FIELD.format(index=i) for i in range(count))
+    return f"mutation({params}) {{{fields}\n}}\n"
 
 
 def run_gh_graphql(query: str, variables: dict) -> dict:
@@ -41,22 +49,32 @@ def run_gh_graphql(query: str, variables: dict) -> dict:
     return json.loads(result.stdout)
 
 
+def resolve_threads(thread_ids: list[str]) -> list[dict]:
+    """Resolve review threads in one mutation, returning them in input order."""
+    variables = {f"t{i}": thread_id for i, thread_id in enumerate(thread_ids)}
+    data = run_gh_graphql(build_mutation(len(thread_ids)), variables)
+    return [data["data"][f"r{i}"]["thread"] for i in range(len(thread_ids))]
+
+
 def resolve_thread(thread_id: str) -> dict:
     """Resolve a review thread."""
-    data = run_gh_graphql(MUTATION, {"threadId": thread_id})
-    return data["data"]["resolveReviewThread"]["thread"]
+    return resolve_threads([thread_id])[0]
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: uv run resolve_thread.py <THREAD_ID>", file=sys.stderr)
+    if len(sys.argv) < 2:
+        print(
+            "Usage: uv run resolve_thread.py <THREAD_ID> [THREAD_ID ...]",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
-    thread_id = sys.argv[1]
+    thread_ids = sys.argv[1:]
 
     try:
-        result = resolve_thread(thread_id)
-        print(json.dumps(result, indent=2))
+        results = resolve_threads(thread_ids)
+        # A single ID keeps the original single-object output
+        print(json.dumps(results[0] if len(results) == 1 else results, indent=2))
     except subprocess.CalledProcessError as e:
         print(f"Error: {e.stderr}", file=sys.stderr)
         sys.exit(1)
@@ -19,6 +19,7 @@ Usage:
 # ///
 
 import argparse
+import os
 import re
 import sys
 from datetime import datetime
@@ -27,6 +28,17 @@ from typing import Any
 
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it (the PyPI wheels
+# are); the pure-Python ones produce the same documents, just slower
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+# YAML frontmatter between --- markers, then the markdown body
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+STUDIES_COUNT_RE = re.compile(r"(\*\*Studies\*\*: )(\d+)")
+
 
 def _read_thoughts_config() -> dict[str, Any] | None:
     """Read ~/.config/thoughts/config.json to discover thoughtsHome and orgGlobal path."""
@@ -68,7 +80,7 @@ def _ensure_catalog(catalog_path: Path) -> Path:
         "\n"
         "*No repositories studied yet.*\n"
     )
-    catalog_path.write_text(initial_content)
+    catalog_path.write_text(initial_content, encoding="utf-8")
     print(f"  Created new catalog at {catalog_path}")
     return catalog_path
 
@@ -77,6 +89,7 @@ def find_catalog(create_if_missing: bool = False) -> Path:
     """Find the global extern catalog.
 
     Resolution order:
+      0. $EXTERN_CATALOG_PATH, if set and the file exists (skips the lookup below)
       1. Read ~/.config/thoughts/config.json → {thoughtsHome}/{orgGlobal.path}/shared/extern/
       2. Walk up from cwd looking for thoughts/global/org/shared/extern/ (project symlink)
       3. Fallback: ~/thoughts/global/shared/extern/ (default home path)
@@ -84,6 +97,13 @@ def find_catalog(create_if_missing: bool = False) -> Path:
     If create_if_missing is True, creates the catalog at the canonical location
     (from thoughts config) when it doesn't exist.
     """
+    # 0. Explicit override: one stat instead of the config read and cwd walk
+    override = os.environ.get("EXTERN_CATALOG_PATH")
+    if override:
+        override_path = Path(override).expanduser()
+        if override_path.is_file():
+            return override_path
+
     candidates: list[Path] = []
 
     # 1. Canonical: read thoughts config for thoughtsHome + orgGlobal.path
@@ -143,28 +163,51 @@ def parse_catalog(catalog_path: Path) -> tuple[dict[str, Any], str]:
     Returns:
         Tuple of (frontmatter_dict, markdown_body)
     """
-    content = catalog_path.read_text()
+    # Text mode normalizes CRLF (hand-edited catalogs) to the LF the edits
+    # below insert, so a rewritten file never mixes line endings
+    content = catalog_path.read_text(encoding="utf-8")
 
-    # Match YAML frontmatter between --- markers
-    pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(pattern, content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
 
     if not match:
         raise ValueError(f"Invalid catalog format: {catalog_path}")
 
-    frontmatter = yaml.safe_load(match.group(1)) or {}
+    frontmatter = yaml.load(match.group(1), Loader=YamlLoader) or {}
     body = match.group(2)
 
     return frontmatter, body
 
 
+def load_frontmatter(catalog_path: Path) -> dict[str, Any]:
+    """Parse only the YAML frontmatter, stopping at its closing --- marker.
+
+    For read-only commands, which never look at the markdown body.
+    """
+    lines: list[str] = []
+    with catalog_path.open(encoding="utf-8") as f:
+        if f.readline().rstrip() != "---":
+            raise ValueError(f"Invalid catalog format: {catalog_path}")
+        for line in f:
+            if line.rstrip() == "---":
+                break
+            lines.append(line)
+        else:
+            raise ValueError(f"Invalid catalog format: {catalog_path}")
+
+    return yaml.load("".join(lines), Loader=YamlLoader) or {}
+
+
 def save_catalog(catalog_path: Path, frontmatter: dict[str, Any], body: str) -> None:
     """Save catalog with YAML frontmatter and markdown body."""
     yaml_content = yaml.dump(
-        frontmatter, default_flow_style=False, sort_keys=False, allow_unicode=True
+        frontmatter,
+        Dumper=YamlDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
     )
     content = f"---\n{yaml_content}---\n{body}"
-    catalog_path.write_text(content)
+    catalog_path.write_text(content, encoding="utf-8")
 
 
 def cmd_list(args: argparse.Namespace) -> None:
@@ -176,7 +219,7 @@ def cmd_list(args: argparse.Namespace) -> None:
         print("  It will be created automatically on first add-study.\n")
         return
 
-    frontmatter, _ = parse_catalog(catalog_path)
+    frontmatter = load_frontmatter(catalog_path)
     repos = frontmatter.get("repos", [])
 
     print("\n" + "=" * 64)
@@ -187,26 +230,26 @@ def cmd_list(args: argparse.Namespace) -> None:
         print("\nNo repositories have been studied yet.\n")
         return
 
+    # One write for the whole listing rather than several prints per repo
+    out: list[str] = []
     for repo in repos:
         name = repo.get("name", "Unknown")
-        url = repo.get("url", "")
-        study_count = repo.get("study_count", 0)
         topics = repo.get("topics", [])
-        first_studied = repo.get("first_studied", "")
 
-        print(f"\n  {name}")
-        print(f"  {'─' * (len(name) + 2)}")
-        print(f"  URL: {url}")
-        print(f"  First studied: {first_studied}")
-        print(f"  Studies: {study_count}")
+        out.append(f"\n  {name}")
+        out.append(f"  {'─' * (len(name) + 2)}")
+        out.append(f"  URL: {repo.get('url', '')}")
+        out.append(f"  First studied: {repo.get('first_studied', '')}")
+        out.append(f"  Studies: {repo.get('study_count', 0)}")
         if topics:
-            print(f"  Topics: {', '.join(topics)}")
+            out.append(f"  Topics: {', '.join(topics)}")
 
-    print("\n" + "=" * 64)
+    out.append("\n" + "=" * 64)
     total_repos = len(repos)
     total_studies = frontmatter.get("total_studies", 0)
-    print(f"  Total: {total_repos} repos, {total_studies} studies")
-    print("=" * 64 + "\n")
+    out.append(f"  Total: {total_repos} repos, {total_studies} studies")
+    out.append("=" * 64 + "\n")
+    print("\n".join(out))
 
 
 def cmd_search(args: argparse.Namespace) -> None:
@@ -217,31 +260,33 @@ def cmd_search(args: argparse.Namespace) -> None:
         print(f"\nNo results found for '{args.term}' (no catalog exists yet)\n")
         return
 
-    frontmatter, _ = parse_catalog(catalog_path)
+    frontmatter = load_frontmatter(catalog_path)
     repos = frontmatter.get("repos", [])
     term = args.term.lower()
 
-    matches = []
-    for repo in repos:
-        name = repo.get("name", "").lower()
-        url = repo.get("url", "").lower()
-        topics = [t.lower() for t in repo.get("topics", [])]
-
-        if term in name or term in url or any(term in t for t in topics):
-            matches.append(repo)
+    # One lowercased haystack per repo; NUL can't appear in an argv term, so
+    # a match never spans two fields
+    matches = [
+        repo
+        for repo in repos
+        if term
+        in "\0".join(
+            [repo.get("name", ""), repo.get("url", ""), *repo.get("topics", [])]
+        ).lower()
+    ]
 
     if not matches:
         print(f"\nNo results found for '{args.term}'\n")
         return
 
-    print(f"\n Found {len(matches)} match(es) for '{args.term}':\n")
+    out = [f"\n Found {len(matches)} match(es) for '{args.term}':\n"]
     for repo in matches:
-        name = repo.get("name", "Unknown")
         topics = repo.get("topics", [])
-        print(f"  - {name}")
+        out.append(f"  - {repo.get('name', 'Unknown')}")
         if topics:
-            print(f"    Topics: {', '.join(topics)}")
-    print()
+            out.append(f"    Topics: {', '.join(topics)}")
+    out.append("")
+    print("\n".join(out))
 
 
 def cmd_stats(args: argparse.Namespace) -> None:
@@ -252,18 +297,14 @@ def cmd_stats(args: argparse.Namespace) -> None:
         print("\n  No extern research catalog found (0 repos, 0 studies).\n")
         return
 
-    frontmatter, _ = parse_catalog(catalog_path)
+    frontmatter = load_frontmatter(catalog_path)
 
     total_repos = frontmatter.get("total_repos_studied", 0)
     total_studies = frontmatter.get("total_studies", 0)
     last_updated = frontmatter.get("last_updated", "Never")
     repos = frontmatter.get("repos", [])
 
-    # Collect all topics
-    all_topics = []
-    for repo in repos:
-        all_topics.extend(repo.get("topics", []))
-    unique_topics = set(all_topics)
+    unique_topics = set().union(*(repo.get("topics", ()) for repo in repos))
 
     print("\n" + "=" * 40)
     print("  Extern Research Statistics")
@@ -284,11 +325,10 @@ def cmd_add_study(args: argparse.Namespace) -> None:
     today = datetime.now().strftime("%Y-%m-%d")
 
     # Find or create repo entry
-    repo_entry = None
-    for repo in repos:
-        if repo.get("name") == args.repo or repo.get("url") == args.url:
-            repo_entry = repo
-            break
+    repo_entry = next(
+        (r for r in repos if r.get("name") == args.repo or r.get("url") == args.url),
+        None,
+    )
 
     if repo_entry is None:
         # Create new repo entry
@@ -339,38 +379,31 @@ def cmd_add_study(args: argparse.Namespace) -> None:
         else:
             body = body.rstrip() + "\n" + new_section
     else:
-        # Add row to existing table
-        lines = body.split("\n")
-        new_lines = []
-        in_section = False
-        table_found = False
-
-        for i, line in enumerate(lines):
-            new_lines.append(line)
-            if section_header in line:
-                in_section = True
-            elif (
-                in_section
-                and line.startswith("|")
-                and "---" not in line
-                and "Date" not in line
-            ):
-                if not table_found:
-                    # Insert new row after header row
-                    new_lines.append(
-                        f"| {today} | {args.topic} | [{args.document}]({args.document}) | {args.context} |"
-                    )
-                    table_found = True
-                    in_section = False
-
-        body = "\n".join(new_lines)
-
-        # Update study count in section
-        body = re.sub(
-            rf"(\*\*Studies\*\*: )(\d+)",
+        # Edit only this repo's section, which runs up to the next ### heading
+        start = body.index(section_header)
+        end = body.find("\n### ", start + len(section_header))
+        if end == -1:
+            end = len(body)
+        section = body[start:end]
+
+        # Add row right under the table's |---| separator so the newest
+        # study is listed first
+        separator = section.find("\n|-")
+        if separator != -1:
+            line_end = section.find("\n", separator + 1)
+            if line_end == -1:
+                section += "\n"
+                line_end = len(section) - 1
+            new_row = f"| {today} | {args.topic} | [{args.document}]({args.document}) | {args.context} |\n"
+            section = section[: line_end + 1] + new_row + section[line_end + 1 :]
+
+        # Update study count
+        section = STUDIES_COUNT_RE.sub(
             lambda m: f"{m.group(1)}{repo_entry['study_count']}",
-            body,
+            section,
+            count=1,
         )
+        body = body[:start] + section + body[end:]
 
     save_catalog(catalog_path, frontmatter, body)
 